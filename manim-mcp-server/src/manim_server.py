@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
-import subprocess
+import asyncio
+import sys
 import tempfile
 import os
 import shutil
@@ -14,39 +15,66 @@ TEMP_DIRS = {}
 BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "media")
 os.makedirs(BASE_DIR, exist_ok=True)  # Ensure the media folder exists
 
-@mcp.tool()
-def execute_manim_code(manim_code: str) -> str:
-    """Execute the Manim code"""
-    # tmpdir = tempfile.mkdtemp()  # Creates a temp directory that won't be deleted immediately
-    tmpdir = os.path.join(BASE_DIR, "manim_tmp")  
-    os.makedirs(tmpdir, exist_ok=True)  # Ensure the temp folder exists
-    script_path = os.path.join(tmpdir, "scene.py")
-    
+# How many manim processes may render at once; further calls wait for a free slot
+MAX_RENDERS = int(os.getenv("MANIM_MAX_RENDERS", os.cpu_count() or 1))
+_render_slots = None
+
+async def _render(args, cwd, tmpdir):
+    """Run manim as a subprocess without blocking the event loop, so concurrent calls render side by side"""
+    global _render_slots
+    if _render_slots is None:
+        _render_slots = asyncio.Semaphore(MAX_RENDERS)
+
     try:
-        # Write the Manim script to the temp directory
-        with open(script_path, "w") as script_file:
-            script_file.write(manim_code)
-        
-        # Execute Manim with the correct path
-        result = subprocess.run(
-            [MANIM_EXECUTABLE, "-p", script_path], #MANIM_PATH "/Users/[Your_username]/anaconda3/envs/manim2/Scripts/manim.exe"
-            capture_output=True,
-            text=True,
-            cwd=tmpdir
-        )
-
-        if result.returncode == 0:
+        async with _render_slots:
+            proc = await asyncio.create_subprocess_exec(
+                MANIM_EXECUTABLE, *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd
+            )
+            _, stderr = await proc.communicate()
+
+        if proc.returncode == 0:
             TEMP_DIRS[tmpdir] = True
-            print(f"Check the generated video at: {tmpdir}")
+            # stdout carries the MCP protocol on the stdio transport
+            print(f"Check the generated video at: {tmpdir}", file=sys.stderr)
 
-            return "Execution successful. Video generated."
+            return f"Execution successful. Video generated in {tmpdir}"
         else:
-            return f"Execution failed: {result.stderr}"
+            return f"Execution failed: {stderr.decode(errors='replace')}"
 
     except Exception as e:
         return f"Error during execution: {str(e)}"
 
 
+@mcp.tool()
+async def execute_manim_code(manim_code: str) -> str:
+    """Execute the Manim code"""
+    # Each call gets its own directory so concurrent scripts don't overwrite each other
+    tmpdir = tempfile.mkdtemp(prefix="manim_", dir=BASE_DIR)
+    script_path = os.path.join(tmpdir, "scene.py")
+
+    # Write the Manim script to the temp directory
+    with open(script_path, "w") as script_file:
+        script_file.write(manim_code)
+
+    return await _render(["-p", script_path], tmpdir, tmpdir)
+
+
+@mcp.tool()
+async def execute_manim_file(path: str, scene: str = "") -> str:
+    """Render a Manim script from disk, in its own directory so sibling imports resolve"""
+    script_path = os.path.abspath(path)
+    if not os.path.isfile(script_path):
+        return f"File not found: {script_path}"
+
+    tmpdir = tempfile.mkdtemp(prefix="manim_", dir=BASE_DIR)
+
+    # Without a scene name manim prompts for one, which would hang the server
+    args = ["-p", "--media_dir", tmpdir, script_path] + ([scene] if scene else ["-a"])
+    return await _render(args, os.path.dirname(script_path), tmpdir)
+
 
 @mcp.tool()
 def cleanup_manim_temp_dir(directory: str) -> str:
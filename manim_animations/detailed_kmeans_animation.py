@@ -240,8 +240,8 @@ class DetailedKMeansAnimation(Scene):
             if method != "Manual":
                 assignment_lines = VGroup()
                 for point_idx, point in enumerate(data):
-                    distances = [np.linalg.norm(point - centroid) for centroid in centroid_positions]
-                    closest_centroid = np.argmin(distances)
+                    sq_distances = ((centroid_positions - point) ** 2).sum(axis=1)
+                    closest_centroid = sq_distances.argmin()
                     
                     line = Line(
                         axes.coords_to_point(point[0], point[1]),
@@ -333,8 +333,8 @@ class DetailedKMeansAnimation(Scene):
             assignment_lines = VGroup()
             
             for i, point in enumerate(data):
-                distances = [np.linalg.norm(point - centroid) for centroid in current_centroids]
-                closest_centroid = np.argmin(distances)
+                sq_distances = ((current_centroids - point) ** 2).sum(axis=1)
+                closest_centroid = sq_distances.argmin()
                 assignments.append(closest_centroid)
                 
                 # Create assignment line
@@ -471,8 +471,8 @@ class DetailedKMeansAnimation(Scene):
         points = VGroup()
         for i, point in enumerate(data):
             # Determine cluster assignment
-            distances = [np.linalg.norm(point - centroid) for centroid in final_centroids]
-            closest_centroid = np.argmin(distances)
+            sq_distances = ((final_centroids - point) ** 2).sum(axis=1)
+            closest_centroid = sq_distances.argmin()
             
             dot = Dot(
                 axes.coords_to_point(point[0], point[1]),
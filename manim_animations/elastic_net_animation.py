@@ -1,5 +1,44 @@
 from manim import *
 import numpy as np
+from text_cache import cached_text as _text
+
+_RNG = np.random.default_rng(42)
+
+N_BOOTSTRAP = 5
+FIT_XS = np.linspace(0.5, 9.5, 256)  # Shared grid every fitted curve is evaluated on
+
+def bootstrap_polyfits(x_samples, y_samples, deg):
+    """Least-squares polynomial coefficients (highest power first) for each row of a (B, N) resample"""
+    # Same scaled-Vandermonde pseudo-inverse np.polyfit uses, batched over all B resamples
+    vander = x_samples[..., None] ** np.arange(deg, -1, -1)
+    scale = np.sqrt((vander ** 2).sum(axis=1, keepdims=True))
+    coeffs = np.linalg.pinv(vander / scale, rcond=x_samples.shape[-1] * np.finfo(float).eps) @ y_samples[..., None]
+    return coeffs[..., 0] / scale[:, 0]
+
+def fitted_curve_group(axes, coeffs, color):
+    """Line graphs of each coefficient row evaluated on FIT_XS"""
+    curve_ys = coeffs @ np.vander(FIT_XS, coeffs.shape[1]).T
+    return VGroup(*[
+        axes.plot_line_graph(FIT_XS, ys, line_color=color, add_vertex_dots=False, stroke_width=2, stroke_opacity=0.7)
+        for ys in curve_ys
+    ])
+
+def reg_path_curves(n=100):
+    """Bias², variance and total error along the regularization path, plus the argmin of the total"""
+    x_vals = np.linspace(0.1, 10, n)
+    bias_sq = 0.05 + 0.3 * (1 - np.exp(-x_vals/3))
+    variance = 0.8 * np.exp(-x_vals/2) + 0.1
+    total_error = bias_sq + variance
+    return x_vals, bias_sq, variance, total_error, int(np.argmin(total_error))
+
+REG_PATH = reg_path_curves()
+
+# Bias² and variance of each model in the quantitative comparison
+UNREG_ERRORS = [0.1, 0.8]
+ELASTIC_ERRORS = [0.3, 0.2]
+TOTAL_UNREG = sum(UNREG_ERRORS)
+TOTAL_ELASTIC = sum(ELASTIC_ERRORS)
+IMPROVEMENT_PCT = (TOTAL_UNREG - TOTAL_ELASTIC) / TOTAL_UNREG * 100
 
 class ElasticNetAnimation(Scene):
     """
@@ -12,13 +51,16 @@ class ElasticNetAnimation(Scene):
         self.next_section("BiasVarianceDecomposition", skip_animations=False)
         self.show_bias_variance_decomposition()
 
+        # Parts 2 and 3 share the same axes and noisy samples
+        scatter = self.make_scatter_axes()
+
         # Part 2: Unregularized Model
         self.next_section("UnregularizedModel", skip_animations=False)
-        self.show_unregularized_model()
+        self.show_unregularized_model(*scatter)
 
         # Part 3: Elastic Net Regularization
         self.next_section("ElasticNetEffect", skip_animations=False)
-        self.show_elastic_net_effect()
+        self.show_elastic_net_effect(*scatter)
 
         # Part 4: Quantitative Comparison
         self.next_section("QuantitativeComparison", skip_animations=False)
@@ -34,7 +76,7 @@ class ElasticNetAnimation(Scene):
 
     def show_bias_variance_decomposition(self):
         """Part 1: Introduce the bias-variance decomposition."""
-        title = Text("Bias-Variance Tradeoff", font_size=48, color=YELLOW).to_edge(UP)
+        title = _text("Bias-Variance Tradeoff", font_size=48, color=YELLOW).to_edge(UP)
         formula = MathTex(
             r"E[(y - \hat{y})^2]", r"=", r"\text{Bias}^2", r"+", r"\text{Variance}", r"+", r"\text{Irreducible Error}",
             font_size=36
@@ -54,8 +96,8 @@ class ElasticNetAnimation(Scene):
             Triangle(color=ORANGE, fill_opacity=1).scale(0.5).shift(DOWN * 0.25)
         ).next_to(formula, DOWN, buff=1)
         
-        bias_label = Text("Bias", color=RED).next_to(seesaw[0].get_start(), DOWN)
-        variance_label = Text("Variance", color=BLUE).next_to(seesaw[0].get_end(), DOWN)
+        bias_label = _text("Bias", color=RED).next_to(seesaw[0].get_start(), DOWN)
+        variance_label = _text("Variance", color=BLUE).next_to(seesaw[0].get_end(), DOWN)
         
         self.play(Create(seesaw), Write(bias_label), Write(variance_label))
         self.play(seesaw[0].animate.rotate(0.2, about_point=seesaw.get_center()))
@@ -65,19 +107,16 @@ class ElasticNetAnimation(Scene):
         self.play(seesaw[0].animate.rotate(0.2, about_point=seesaw.get_center()))
         self.wait(1)
         
-        self.play(FadeOut(title, formula, seesaw, bias_label, variance_label))
-
-    def show_unregularized_model(self):
-        """Part 2: Show an unregularized model with high variance."""
-        title = Text("Unregularized Model", font_size=36, color=WHITE).to_edge(UP)
-        subtitle = Text("Low Bias, High Variance", font_size=28).next_to(title, DOWN)
-        subtitle[0][0:8].set_color(RED)
-        subtitle[0][10:].set_color(BLUE)
-        
-        self.play(Write(title), Write(subtitle))
+        self.play(FadeOut(VGroup(title, formula, seesaw, bias_label, variance_label)))
 
-        # Setup axes and data
-        axes = Axes(x_range=[0, 10, 1], y_range=[-2, 2, 1], x_length=10, y_length=5).add_coordinates()
+    def make_scatter_axes(self):
+        """Axes, true curve and noisy samples used by the bootstrap sections."""
+        # No tick numbers: the sections are about the spread of the curves, not their values
+        axes = Axes(
+            x_range=[0, 10, 1], y_range=[-2, 2, 1],
+            x_length=10, y_length=5,
+            axis_config={"include_ticks": True, "include_numbers": False}
+        )
         
         # True function
         def true_func(x):
@@ -86,95 +125,82 @@ class ElasticNetAnimation(Scene):
         true_curve = axes.plot(true_func, color=GREEN)
         
         # Generate data points
-        np.random.seed(42)
         x_data = np.linspace(1, 9, 20)
-        y_data = true_func(x_data) + np.random.normal(0, 0.5, len(x_data))
-        dots = VGroup(*[Dot(axes.c2p(x, y), color=LIGHT_GRAY) for x, y in zip(x_data, y_data)])
+        y_data = true_func(x_data) + _RNG.normal(0.0, 0.5, size=x_data.shape)
+        # c2p on whole coordinate arrays returns a (3, N) array of points
+        points = axes.c2p(x_data, y_data).T
+        dots = VGroup(*[Dot(p, color=LIGHT_GRAY) for p in points])
+        
+        return axes, true_curve, dots, x_data, y_data
+
+    def show_unregularized_model(self, axes, true_curve, dots, x_data, y_data):
+        """Part 2: Show an unregularized model with high variance."""
+        title = _text("Unregularized Model", font_size=36, color=WHITE).to_edge(UP)
+        subtitle = _text("Low Bias, High Variance", font_size=28).next_to(title, DOWN)
+        subtitle[0][0:8].set_color(RED)
+        subtitle[0][10:].set_color(BLUE)
+        
+        self.play(Write(title), Write(subtitle))
 
         self.play(Create(axes), Create(true_curve), FadeIn(dots))
         self.wait(1)
 
-        # Fit multiple high-degree polynomial models (simulating bootstrap)
-        fitted_curves = VGroup()
-        for i in range(5):
-            sample_indices = np.random.choice(len(x_data), len(x_data), replace=True)
-            x_sample = x_data[sample_indices]
-            y_sample = y_data[sample_indices]
-            
-            poly_fit = np.poly1d(np.polyfit(x_sample, y_sample, 9))
-            
-            curve = axes.plot(lambda x: poly_fit(x), color=BLUE, stroke_width=2, stroke_opacity=0.7)
-            fitted_curves.add(curve)
-
-        self.play(Create(fitted_curves, lag_ratio=0.5))
+        # Fit multiple high-degree polynomial models (simulating bootstrap), all resamples at once
+        sample_indices = _RNG.integers(0, len(x_data), size=(N_BOOTSTRAP, len(x_data)))
+        coeffs = bootstrap_polyfits(x_data[sample_indices], y_data[sample_indices], 9)
+        fitted_curves = fitted_curve_group(axes, coeffs, BLUE)
+
+        self.play(LaggedStart(*[FadeIn(curve) for curve in fitted_curves], lag_ratio=0.5))
         
-        variance_text = Text("Many different prediction curves\n(High Variance)", font_size=24, color=BLUE).to_corner(UR)
+        variance_text = _text("Many different prediction curves\n(High Variance)", font_size=24, color=BLUE).to_corner(UR)
         self.play(Write(variance_text))
         self.wait(2)
         
-        self.play(FadeOut(title, subtitle, axes, true_curve, dots, fitted_curves, variance_text))
+        # The axes and samples stay on screen for the elastic net section
+        self.play(FadeOut(VGroup(title, subtitle, true_curve, fitted_curves, variance_text)))
 
-    def show_elastic_net_effect(self):
+    def show_elastic_net_effect(self, axes, true_curve, dots, x_data, y_data):
         """Part 3: Demonstrate Elastic Net's effect on variance."""
-        title = Text("Elastic Net Regularization", font_size=36, color=WHITE).to_edge(UP)
-        subtitle = Text("Higher Bias, Lower Variance", font_size=28).next_to(title, DOWN)
+        title = _text("Elastic Net Regularization", font_size=36, color=WHITE).to_edge(UP)
+        subtitle = _text("Higher Bias, Lower Variance", font_size=28).next_to(title, DOWN)
         subtitle[0][0:11].set_color(RED)
         subtitle[0][13:].set_color(BLUE)
         
         self.play(Write(title), Write(subtitle))
 
-        axes = Axes(x_range=[0, 10, 1], y_range=[-2, 2, 1], x_length=10, y_length=5).add_coordinates()
+        # Animate from unregularized to regularized
+        sample_indices = _RNG.integers(0, len(x_data), size=(N_BOOTSTRAP, len(x_data)))
+        x_samples, y_samples = x_data[sample_indices], y_data[sample_indices]
         
-        def true_func(x):
-            return np.sin(x * 0.8)
-            
-        np.random.seed(42)
-        x_data = np.linspace(1, 9, 20)
-        y_data = true_func(x_data) + np.random.normal(0, 0.5, len(x_data))
-        dots = VGroup(*[Dot(axes.c2p(x, y), color=LIGHT_GRAY) for x, y in zip(x_data, y_data)])
+        # Unregularized
+        unreg_coeffs = bootstrap_polyfits(x_samples, y_samples, 9)
+        unregularized_curves = fitted_curve_group(axes, unreg_coeffs, BLUE)
 
-        self.play(Create(axes), FadeIn(dots))
+        # Regularized (simulated by fitting a lower-degree polynomial)
+        reg_coeffs = bootstrap_polyfits(x_samples, y_samples, 3)
+        regularized_curves = fitted_curve_group(axes, reg_coeffs, RED)
 
-        # Animate from unregularized to regularized
-        regularized_curves = VGroup()
-        unregularized_curves = VGroup()
-
-        for i in range(5):
-            sample_indices = np.random.choice(len(x_data), len(x_data), replace=True)
-            x_sample = x_data[sample_indices]
-            y_sample = y_data[sample_indices]
-            
-            # Unregularized
-            poly_fit_unreg = np.poly1d(np.polyfit(x_sample, y_sample, 9))
-            curve_unreg = axes.plot(lambda x: poly_fit_unreg(x), color=BLUE, stroke_width=2, stroke_opacity=0.7)
-            unregularized_curves.add(curve_unreg)
-
-            # Regularized (simulated by fitting a lower-degree polynomial)
-            poly_fit_reg = np.poly1d(np.polyfit(x_sample, y_sample, 3))
-            curve_reg = axes.plot(lambda x: poly_fit_reg(x), color=RED, stroke_width=2, stroke_opacity=0.7)
-            regularized_curves.add(curve_reg)
-
-        self.play(Create(unregularized_curves))
+        self.play(LaggedStart(*[FadeIn(curve) for curve in unregularized_curves], lag_ratio=0.5))
         self.wait(1)
         
-        shrink_text = Text("Coefficients pulled toward zero", font_size=24).to_corner(UR)
+        shrink_text = _text("Coefficients pulled toward zero", font_size=24).to_corner(UR)
         self.play(Write(shrink_text))
         self.play(Transform(unregularized_curves, regularized_curves))
         
-        variance_text = Text("Predictions are more similar\n(Lower Variance)", font_size=24, color=BLUE).move_to(shrink_text)
+        variance_text = _text("Predictions are more similar\n(Lower Variance)", font_size=24, color=BLUE).move_to(shrink_text)
         self.play(FadeOut(shrink_text), Write(variance_text))
         self.wait(2)
 
-        self.play(FadeOut(title, subtitle, axes, dots, unregularized_curves, variance_text))
+        self.play(FadeOut(VGroup(title, subtitle, axes, dots, unregularized_curves, variance_text)))
 
     def show_quantitative_comparison(self):
         """Part 4: Side-by-side bar charts of error components."""
-        title = Text("Quantitative Comparison", font_size=36, color=WHITE).to_edge(UP)
+        title = _text("Quantitative Comparison", font_size=36, color=WHITE).to_edge(UP)
         self.play(Write(title))
 
         # Data for charts
-        unreg_data = [0.1, 0.8]
-        elastic_data = [0.3, 0.2]
+        unreg_data = UNREG_ERRORS
+        elastic_data = ELASTIC_ERRORS
         
         # Unregularized Chart
         chart_unreg = BarChart(
@@ -186,21 +212,16 @@ class ElasticNetAnimation(Scene):
             x_length=4,
         ).to_edge(LEFT, buff=1)
         
-        unreg_title = Text("Unregularized", font_size=24).next_to(chart_unreg, UP)
-        total_unreg = Text(f"Total Error = {sum(unreg_data):.1f}", font_size=20).next_to(chart_unreg, DOWN)
+        unreg_title = _text("Unregularized", font_size=24).next_to(chart_unreg, UP)
+        total_unreg = _text(f"Total Error = {TOTAL_UNREG:.1f}", font_size=20).next_to(chart_unreg, DOWN)
 
-        # Elastic Net Chart
-        chart_elastic = BarChart(
-            values=elastic_data,
-            bar_names=["Bias²", "Variance"],
-            y_range=[0, 1, 0.2],
-            bar_colors=[RED, BLUE],
-            y_length=5,
-            x_length=4,
-        ).to_edge(RIGHT, buff=1)
+        # Elastic Net Chart: same axes and bar names, so copy the chart and only change the bar heights
+        chart_elastic = chart_unreg.copy()
+        chart_elastic.change_bar_values(elastic_data)
+        chart_elastic.to_edge(RIGHT, buff=1)
         
-        elastic_title = Text("Elastic Net", font_size=24).next_to(chart_elastic, UP)
-        total_elastic = Text(f"Total Error = {sum(elastic_data):.1f}", font_size=20).next_to(chart_elastic, DOWN)
+        elastic_title = _text("Elastic Net", font_size=24).next_to(chart_elastic, UP)
+        total_elastic = _text(f"Total Error = {TOTAL_ELASTIC:.1f}", font_size=20).next_to(chart_elastic, DOWN)
 
         self.play(
             Write(unreg_title), Create(chart_unreg), Write(total_unreg),
@@ -209,18 +230,17 @@ class ElasticNetAnimation(Scene):
         self.wait(2)
 
         # Show net improvement
-        improvement = ((sum(unreg_data) - sum(elastic_data)) / sum(unreg_data)) * 100
-        improvement_text = Text(f"Net Improvement: {improvement:.0f}% reduction in error", font_size=28, color=GREEN)
+        improvement_text = _text(f"Net Improvement: {IMPROVEMENT_PCT:.0f}% reduction in error", font_size=28, color=GREEN)
         improvement_text.next_to(VGroup(chart_unreg, chart_elastic), DOWN, buff=1)
         
         self.play(Write(improvement_text))
         self.wait(2)
         
-        self.play(FadeOut(title, unreg_title, chart_unreg, total_unreg, elastic_title, chart_elastic, total_elastic, improvement_text))
+        self.play(FadeOut(VGroup(title, unreg_title, chart_unreg, total_unreg, elastic_title, chart_elastic, total_elastic, improvement_text)))
 
     def show_regularization_path(self):
         """Part 5: Plot error components vs. regularization strength."""
-        title = Text("Finding the Sweet Spot", font_size=36, color=WHITE).to_edge(UP)
+        title = _text("Finding the Sweet Spot", font_size=36, color=WHITE).to_edge(UP)
         self.play(Write(title))
 
         axes = Axes(
@@ -228,26 +248,25 @@ class ElasticNetAnimation(Scene):
             x_length=10, y_length=5,
             axis_config={"color": GRAY},
             x_axis_config={"include_numbers": True}
-        ).add_coordinates()
+        )
         
         x_label = axes.get_x_axis_label(Tex("Regularization Strength $\lambda$"), edge=DOWN, direction=DOWN)
         y_label = axes.get_y_axis_label(Tex("Error"), edge=LEFT, direction=LEFT)
         
         self.play(Create(axes), Write(x_label), Write(y_label))
 
-        # Define curves
-        x_vals = np.linspace(0.1, 10, 100)
-        bias_sq = 0.05 + 0.3 * (1 - np.exp(-x_vals/3))
-        variance = 0.8 * np.exp(-x_vals/2) + 0.1
-        total_error = bias_sq + variance
+        # Curves are computed once at import
+        x_vals, bias_sq, variance, total_error, optimal_idx = REG_PATH
 
-        bias_curve = axes.plot_line_graph(x_vals, bias_sq, line_color=RED)
-        var_curve = axes.plot_line_graph(x_vals, variance, line_color=BLUE)
-        total_curve = axes.plot_line_graph(x_vals, total_error, line_color=GREEN)
+        # Straight segments through all 100 samples, mapped through the axes in one c2p call per curve
+        bias_curve, var_curve, total_curve = [
+            VMobject(color=color, stroke_width=2).set_points_as_corners(axes.c2p(x_vals, ys).T)
+            for ys, color in ((bias_sq, RED), (variance, BLUE), (total_error, GREEN))
+        ]
 
-        bias_label = Text("Bias²", font_size=24, color=RED).next_to(axes.c2p(x_vals[-1], bias_sq[-1]), UR)
-        var_label = Text("Variance", font_size=24, color=BLUE).next_to(axes.c2p(x_vals[0], variance[0]), UR)
-        total_label = Text("Total Error", font_size=24, color=GREEN).next_to(axes.c2p(x_vals[-1], total_error[-1]), DR)
+        bias_label = _text("Bias²", font_size=24, color=RED).next_to(axes.c2p(x_vals[-1], bias_sq[-1]), UR)
+        var_label = _text("Variance", font_size=24, color=BLUE).next_to(axes.c2p(x_vals[0], variance[0]), UR)
+        total_label = _text("Total Error", font_size=24, color=GREEN).next_to(axes.c2p(x_vals[-1], total_error[-1]), DR)
 
         self.play(Create(bias_curve), Write(bias_label))
         self.play(Create(var_curve), Write(var_label))
@@ -255,29 +274,28 @@ class ElasticNetAnimation(Scene):
         self.wait(1)
 
         # Highlight optimal lambda
-        optimal_idx = np.argmin(total_error)
         optimal_lambda = x_vals[optimal_idx]
         optimal_point = Dot(axes.c2p(optimal_lambda, total_error[optimal_idx]), color=YELLOW)
         arrow = Arrow(optimal_point.get_center() + UP*1.5, optimal_point.get_center(), color=YELLOW)
-        sweet_spot_text = Text("Sweet Spot", font_size=24, color=YELLOW).next_to(arrow, UP)
+        sweet_spot_text = _text("Sweet Spot", font_size=24, color=YELLOW).next_to(arrow, UP)
 
         self.play(GrowArrow(arrow), Write(sweet_spot_text), FadeIn(optimal_point))
         self.wait(2)
         
-        self.play(FadeOut(title, axes, x_label, y_label, bias_curve, var_curve, total_curve, bias_label, var_label, total_label, arrow, sweet_spot_text, optimal_point))
+        self.play(FadeOut(VGroup(title, axes, x_label, y_label, bias_curve, var_curve, total_curve, bias_label, var_label, total_label, arrow, sweet_spot_text, optimal_point)))
 
     def show_summary(self):
         """Final summary of key takeaways."""
-        title = Text("Key Takeaways", font_size=42, color=YELLOW).to_edge(UP)
+        title = _text("Key Takeaways", font_size=42, color=YELLOW).to_edge(UP)
         self.play(Write(title))
 
         insights = VGroup(
-            Text("• Regularization trades a small increase in bias...", color=WHITE, font_size=28),
-            Text("  ...for a large decrease in variance.", color=BLUE, font_size=28),
-            Text("• This leads to a lower overall prediction error.", color=GREEN, font_size=28),
-            Text("• The optimal λ minimizes the bias-variance tradeoff.", color=YELLOW, font_size=28)
+            _text("• Regularization trades a small increase in bias...", color=WHITE, font_size=28),
+            _text("  ...for a large decrease in variance.", color=BLUE, font_size=28),
+            _text("• This leads to a lower overall prediction error.", color=GREEN, font_size=28),
+            _text("• The optimal λ minimizes the bias-variance tradeoff.", color=YELLOW, font_size=28)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.5).next_to(title, DOWN, buff=1)
 
         self.play(FadeIn(insights, lag_ratio=0.5, shift=UP))
         self.wait(4)
-        self.play(FadeOut(*self.mobjects))
\ No newline at end of file
+        self.play(FadeOut(Group(*self.mobjects)))
\ No newline at end of file
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+import threaded_frame_writer  # noqa: F401  (writes frames to ffmpeg on a background thread)
 
 class InteractionEffectScene(Scene):
     def construct(self):
@@ -34,56 +35,68 @@ class InteractionEffectScene(Scene):
         main_effect_slope = 0.5
         interaction_effect_slope = 0.6
         intercept = 2.0
+
+        # The axes map is affine, so evaluate it once and reuse it for every
+        # dot, line and brace endpoint below (scalars or arrays of coordinates)
+        origin = ax.coords_to_point(0, 0)
+        bx = ax.coords_to_point(1, 0) - origin
+        by = ax.coords_to_point(0, 1) - origin
+
+        def c2p(x, y):
+            return origin + np.multiply.outer(x, bx) + np.multiply.outer(y, by)
+
+        def group1_y(x):
+            return main_effect_slope * x + intercept
+
+        def group2_y(x):
+            return (main_effect_slope + interaction_effect_slope) * x + intercept
         
         # 3. Create data points for two groups
-        group1_dots = VGroup(*[
-            Dot(ax.coords_to_point(x, main_effect_slope * x + intercept + np.random.uniform(-0.5, 0.5)), color=BLUE)
-            for x in np.arange(1, 9, 0.5)
-        ])
-        
-        group2_dots = VGroup(*[
-            Dot(ax.coords_to_point(x, (main_effect_slope + interaction_effect_slope) * x + intercept + np.random.uniform(-0.5, 0.5)), color=RED)
-            for x in np.arange(1, 9, 0.5)
-        ])
+        rng = np.random.default_rng(0)
+        xs = np.arange(1, 9, 0.5)
+        pts1 = c2p(xs, group1_y(xs) + rng.uniform(-0.5, 0.5, xs.size))
+        pts2 = c2p(xs, group2_y(xs) + rng.uniform(-0.5, 0.5, xs.size))
+
+        # Line and brace endpoints at x = 0, 7 and 9 for both groups
+        x_anchor = np.array([0, 7, 9])
+        anchor1 = c2p(x_anchor, group1_y(x_anchor))
+        anchor2 = c2p(x_anchor, group2_y(x_anchor))
+        group1_dots = VGroup(*map(Dot, pts1)).set_color(BLUE)
+        group2_dots = VGroup(*map(Dot, pts2)).set_color(RED)
         
         # 4. ANIMATION SEQUENCE STARTS HERE
+        # Nothing in this scene has updaters, so every wait re-emits one static
+        # frame instead of re-rendering the (growing) set of mobjects on screen
         self.play(Create(ax), Write(x_label), Write(y_label))
-        self.wait(0.5)
+        self.wait(0.5, frozen_frame=True)
 
         # Show baseline group and its regression line
         legend_group1 = VGroup(Dot(color=BLUE), Text("Baseline Group", color=BLACK, font_size=28)).arrange(RIGHT).to_edge(UR)
         self.play(FadeIn(group1_dots, shift=UP), Write(legend_group1))
         
         # Line for the main effect
-        main_effect_line = ax.plot(lambda x: main_effect_slope * x + intercept, x_range=[0, 9], color=BLUE)
+        # Straight lines only need their two endpoints, not a sampled graph
+        main_effect_line = Line(anchor1[0], anchor1[2], color=BLUE)
         line_label_main = MathTex(r"\text{Slope} = \beta_1", color=BLUE, font_size=36).next_to(main_effect_line, UR, buff=-1.5)
         
         self.play(Create(main_effect_line), Write(line_label_main))
-        self.wait(1)
+        self.wait(1, frozen_frame=True)
 
         # Introduce the second group
         legend_group2 = VGroup(Dot(color=RED), Text("Group B", color=BLACK, font_size=28)).arrange(RIGHT).next_to(legend_group1, DOWN)
         self.play(FadeIn(group2_dots, shift=UP), Write(legend_group2))
-        self.wait(1)
+        self.wait(1, frozen_frame=True)
 
         # Line for the interaction effect
-        interaction_line = ax.plot(lambda x: (main_effect_slope + interaction_effect_slope) * x + intercept, x_range=[0, 9], color=RED)
+        interaction_line = Line(anchor2[0], anchor2[2], color=RED)
         
         self.play(Create(interaction_line))
-        self.wait(1)
+        self.wait(1, frozen_frame=True)
         
         # Use a brace to show the interaction effect
         # We create two lines to form a visual wedge for the brace
-        brace_line1 = DashedLine(
-            ax.coords_to_point(7, main_effect_slope * 7 + intercept),
-            ax.coords_to_point(9, main_effect_slope * 9 + intercept),
-            color=BLUE
-        )
-        brace_line2 = DashedLine(
-            ax.coords_to_point(7, main_effect_slope * 7 + intercept),
-            ax.coords_to_point(9, (main_effect_slope + interaction_effect_slope) * 9 + intercept),
-            color=RED
-        )
+        brace_line1 = DashedLine(anchor1[1], anchor1[2], color=BLUE)
+        brace_line2 = DashedLine(anchor1[1], anchor2[2], color=RED)
         brace = Brace(brace_line2, direction=brace_line2.get_unit_vector() + 0.9*UP + 0.5*RIGHT, color=BLACK)
         
         interaction_label = MathTex(r"\beta_2 (\text{Interaction})", color=DARK_GRAY, font_size=36)
@@ -95,16 +108,16 @@ class InteractionEffectScene(Scene):
             Create(brace_line2)
         )
         self.play(GrowFromCenter(brace), Write(interaction_label))
-        self.wait(1)
+        self.wait(1, frozen_frame=True)
         
         # Final descriptive text
         final_text_group_1 = MathTex(r"\text{Baseline Slope} = \beta_1 (\text{Main Effect})", color=BLUE).next_to(ax, DOWN, buff=1.2, aligned_edge=LEFT)
         final_text_group_2 = MathTex(r"\text{Group B Slope} = \beta_1 + \beta_2", color=RED).next_to(final_text_group_1, DOWN, buff=0.2, aligned_edge=LEFT)
 
         self.play(Write(final_text_group_1))
-        self.wait(0.5)
+        self.wait(0.5, frozen_frame=True)
         self.play(Write(final_text_group_2))
-        self.wait(3)
+        self.wait(3, frozen_frame=True)
 
         # Add explanation of what interaction means
         explanation_title = Text("What This Means:", color=BLACK, font_size=32).next_to(final_text_group_2, DOWN, buff=0.5, aligned_edge=LEFT)
@@ -117,7 +130,7 @@ class InteractionEffectScene(Scene):
         
         self.play(Write(explanation_title))
         self.play(Write(explanation_text))
-        self.wait(3)
+        self.wait(3, frozen_frame=True)
 
         # Show the mathematical model
         model_title = Text("Mathematical Model:", color=BLACK, font_size=32).move_to(UP * 2 + RIGHT * 3)
@@ -128,7 +141,7 @@ class InteractionEffectScene(Scene):
         
         self.play(Write(model_title))
         self.play(Write(model_equation))
-        self.wait(2)
+        self.wait(2, frozen_frame=True)
 
         # Final summary
         summary_text = Text(
@@ -137,7 +150,7 @@ class InteractionEffectScene(Scene):
         ).move_to(DOWN * 3.5)
         
         self.play(Write(summary_text))
-        self.wait(3)
+        self.wait(3, frozen_frame=True)
 
         # Fade out everything
         self.play(FadeOut(VGroup(
@@ -147,4 +160,4 @@ class InteractionEffectScene(Scene):
             final_text_group_1, final_text_group_2, explanation_title, explanation_text,
             model_title, model_equation, summary_text
         )))
-        self.wait(1)
+        self.wait(1, frozen_frame=True)
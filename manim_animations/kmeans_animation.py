@@ -1,12 +1,12 @@
 from manim import *
 import numpy as np
-from sklearn.cluster import KMeans
+from text_cache import cached_text as _text
+import threaded_frame_writer  # noqa: F401  (writes frames to ffmpeg on a background thread)
+from scipy.spatial import cKDTree
 
 # Data generation function (copied from data_generator.py for self-containment)
 def generate_cluster_data(n_samples_per_cluster=100, n_clusters=3, random_seed=42):
-    np.random.seed(random_seed)
-    data = []
-    labels = []
+    rng = np.random.default_rng(random_seed)
 
     centers = [
         [2, 2],   # Cluster 1
@@ -19,14 +19,33 @@ def generate_cluster_data(n_samples_per_cluster=100, n_clusters=3, random_seed=4
         [0.7, 0.7]
     ]
 
-    for i in range(n_clusters):
-        for _ in range(n_samples_per_cluster):
-            x = np.random.normal(loc=centers[i][0], scale=stds[i][0])
-            y = np.random.normal(loc=centers[i][1], scale=stds[i][1])
-            data.append([x, y])
-            labels.append(i)
-
-    return np.array(data), np.array(labels)
+    # Draw every cluster's samples in one call and shift/scale them per cluster
+    loc = np.repeat(np.array(centers[:n_clusters], dtype=float), n_samples_per_cluster, axis=0)
+    scale = np.repeat(np.array(stds[:n_clusters], dtype=float), n_samples_per_cluster, axis=0)
+    data = loc + scale * rng.standard_normal(loc.shape)
+    labels = np.repeat(np.arange(n_clusters), n_samples_per_cluster)
+
+    return data, labels
+
+def _lloyd_step(data, centroids):
+    """One Lloyd iteration: assign each point to its nearest centroid, then
+    move every centroid to the mean of its points (empty clusters stay put)."""
+    _, labels = cKDTree(centroids).query(data, k=1)
+
+    n_clusters = centroids.shape[0]
+    sums = np.zeros_like(centroids, dtype=float)
+    np.add.at(sums, labels, data)
+    counts = np.bincount(labels, minlength=n_clusters)
+    new_centroids = centroids.astype(float)
+    nonempty = counts > 0
+    new_centroids[nonempty] = sums[nonempty] / counts[nonempty, None]
+    return labels, new_centroids
+
+def _to_3d(points):
+    """Promote (N, 2) points to Manim's (N, 3) coordinates with z = 0."""
+    points_3d = np.zeros((points.shape[0], 3))
+    points_3d[:, :2] = points
+    return points_3d
 
 class KMeansAnimation(Scene):
     def construct(self):
@@ -45,30 +64,32 @@ class KMeansAnimation(Scene):
         scaled_data += np.array([0, 0]) # Center around origin
 
         # Convert to 3D coordinates for Manim
-        scaled_data_3d = np.column_stack([scaled_data, np.zeros(len(scaled_data))])
-        points_mobjects = VGroup(*[Dot(point) for point in scaled_data_3d])
+        scaled_data_3d = _to_3d(scaled_data)
+        point_dots = list(map(Dot, scaled_data_3d)) # Kept as a list for direct indexing below
+        points_mobjects = VGroup(*point_dots)
         self.play(FadeIn(points_mobjects))
         self.wait(1)
 
         n_clusters = 3
-        kmeans = KMeans(n_clusters=n_clusters, init='random', n_init=1, max_iter=1, random_state=0) # One iteration at a time
+        rng = np.random.default_rng(0)
 
         # Initial centroids
         self.next_section("Initialization")
-        kmeans.fit(data) # Fit once to get initial centroids
-        initial_centroids = kmeans.cluster_centers_
+        initial_centroids = data[rng.choice(data.shape[0], n_clusters, replace=False)] # Random data points
+        centroids = initial_centroids
         
         # Scale initial centroids as well
         scaled_initial_centroids = (initial_centroids - np.mean(data, axis=0)) / np.std(data, axis=0) * 2
         scaled_initial_centroids += np.array([0, 0])
 
         # Convert centroids to 3D coordinates
-        scaled_initial_centroids_3d = np.column_stack([scaled_initial_centroids, np.zeros(len(scaled_initial_centroids))])
-        centroids_mobjects = VGroup(*[Dot(centroid, color=COLOR_MAP[i], radius=0.15) for i, centroid in enumerate(scaled_initial_centroids_3d)])
+        scaled_initial_centroids_3d = _to_3d(scaled_initial_centroids)
+        centroids_mobjects = VGroup(*[Dot(centroid, color=COLOR_LIST[i], radius=0.15) for i, centroid in enumerate(scaled_initial_centroids_3d)])
         self.play(FadeIn(centroids_mobjects))
         self.wait(1)
 
         # Iterations
+        prev_labels = np.full(len(data), -1) # No point has a cluster color yet
         for i in range(3): # Run 3 iterations
             self.next_section(f"Iteration_{i+1}")
             iteration_text = Text(f"Iteration {i+1}").to_edge(UP).shift(DOWN*0.5)
@@ -76,35 +97,37 @@ class KMeansAnimation(Scene):
 
             # Assignment Step
             self.next_section(f"Assignment_{i+1}")
-            assignment_text = Text("Assignment Step").next_to(iteration_text, DOWN)
+            assignment_text = _text("Assignment Step").next_to(iteration_text, DOWN)
             self.play(Write(assignment_text))
 
-            # Predict clusters for current data points
-            current_labels = kmeans.predict(data)
+            # Assign points to the current centroids and compute the updated ones
+            current_labels, new_centroids = _lloyd_step(data, centroids)
             
-            # Animate coloring points
+            # Animate coloring points, one animation per target color for the
+            # points whose cluster actually changed since the last iteration
+            changed = np.flatnonzero(current_labels != prev_labels)
             animations = []
-            for j, point_mobject in enumerate(points_mobjects):
-                animations.append(point_mobject.animate.set_color(COLOR_MAP[current_labels[j]]))
-            self.play(*animations)
+            for label in np.unique(current_labels[changed]):
+                moved = VGroup(*[point_dots[j] for j in changed[current_labels[changed] == label]])
+                animations.append(moved.animate.set_color(COLOR_LIST[label]))
+            if animations:
+                self.play(*animations)
             self.wait(1)
+            prev_labels = current_labels
 
             # Update Step
             self.next_section(f"Update_{i+1}")
-            update_text = Text("Update Step").next_to(assignment_text, DOWN)
+            update_text = _text("Update Step").next_to(assignment_text, DOWN)
             self.play(FadeOut(assignment_text), Write(update_text))
 
-            # Recalculate centroids (Manim doesn't do this, so we simulate by refitting with max_iter=1)
-            kmeans = KMeans(n_clusters=n_clusters, init=kmeans.cluster_centers_, n_init=1, max_iter=1, random_state=0) # Use current centroids as init
-            kmeans.fit(data)
-            new_centroids = kmeans.cluster_centers_
-            
+            centroids = new_centroids
+
             # Scale new centroids
             scaled_new_centroids = (new_centroids - np.mean(data, axis=0)) / np.std(data, axis=0) * 2
             scaled_new_centroids += np.array([0, 0])
 
             # Convert new centroids to 3D coordinates
-            scaled_new_centroids_3d = np.column_stack([scaled_new_centroids, np.zeros(len(scaled_new_centroids))])
+            scaled_new_centroids_3d = _to_3d(scaled_new_centroids)
             
             # Animate centroid movement
             animations = []
@@ -120,15 +143,5 @@ class KMeansAnimation(Scene):
         self.play(Write(final_text))
         self.wait(2)
 
-COLOR_MAP = {
-    0: RED,
-    1: BLUE,
-    2: GREEN,
-    3: YELLOW,
-    4: PURPLE,
-    5: ORANGE,
-    6: TEAL,
-    7: PINK,
-    8: MAROON,
-    9: GOLD
-}
+# Cluster colors indexed directly by label
+COLOR_LIST = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, TEAL, PINK, MAROON, GOLD]
@@ -6,6 +6,45 @@ Shows clustering process and how to choose optimal k using elbow plot
 
 from manim import *
 import numpy as np
+from text_cache import cached_text
+
+def _text(text):
+    """Body text in the scene's default style"""
+    return cached_text(text, font_size=16)
+
+def _simulate_lloyd(X, C0, n_iter=3):
+    """Run n_iter Lloyd iterations from the centers C0 before anything is animated.
+
+    Returns the centers before and after each iteration (n_iter + 1 arrays), the
+    assignments made in each iteration, and the WCSS of each assignment plus a
+    final one against the last centers.
+    """
+    k = len(C0)
+    # Squared norms of the data, reused for every ||x - c||^2 = ||x||^2 + ||c||^2 - 2 x.c
+    point_norms = (X * X).sum(axis=1)
+    centers_t = [np.asarray(C0, dtype=float)]
+    assignments_t = []
+    wcss_t = []
+    
+    for iteration in range(n_iter + 1):
+        centers = centers_t[-1]
+        sq_dists = point_norms[:, None] + (centers ** 2).sum(axis=1)[None, :] - 2 * X @ centers.T
+        assignments = sq_dists.argmin(axis=1)
+        wcss_t.append(sq_dists[np.arange(len(X)), assignments].sum())
+        if iteration == n_iter:
+            break
+        assignments_t.append(assignments)
+        
+        # Update cluster centers (one scatter-add pass; empty clusters keep their center)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, assignments, X)
+        counts = np.bincount(assignments, minlength=k)
+        nonempty = counts > 0
+        new_centers = centers.copy()
+        new_centers[nonempty] = sums[nonempty] / counts[nonempty, None]
+        centers_t.append(new_centers)
+    
+    return centers_t, assignments_t, wcss_t
 
 class KMeansElbowAnimation(Scene):
     def construct(self):
@@ -61,16 +100,14 @@ class KMeansElbowAnimation(Scene):
             self.wait(1)
         
         # Show WCSS formula (simplified)
-        formula_box = RoundedRectangle(
-            width=10, height=1.5,
-            stroke_color=YELLOW, stroke_width=2,
-            fill_color=YELLOW, fill_opacity=0.1
-        )
-        
         formula_text = VGroup(
             Text("WCSS Formula:", font_size=20, color=YELLOW, weight=BOLD),
             Text("Sum of squared distances from points to their cluster centers", font_size=16, color=WHITE, slant=ITALIC)
-        ).arrange(DOWN, buff=0.3).move_to(formula_box.get_center())
+        ).arrange(DOWN, buff=0.3)
+        formula_box = BackgroundRectangle(
+            formula_text, color=YELLOW, fill_opacity=0.1,
+            stroke_width=2, stroke_opacity=1, buff=0.3
+        )
         
         formula_group = VGroup(formula_box, formula_text).next_to(concepts, DOWN, buff=1)
         
@@ -100,35 +137,34 @@ class KMeansElbowAnimation(Scene):
         self.play(Create(axes), Write(x_label), Write(y_label))
         
         # Generate synthetic data (3 natural clusters)
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
-        # Create three distinct blobs
-        cluster1 = np.random.normal([0, 1], 0.8, (20, 2))
-        cluster2 = np.random.normal([4, 5], 0.8, (20, 2))
-        cluster3 = np.random.normal([6, 1], 0.8, (20, 2))
+        # Create three distinct blobs of 20 points from a single draw
+        offsets = np.repeat(np.array([[0, 1], [4, 5], [6, 1]]), 20, axis=0)
+        data_points = offsets + rng.standard_normal((60, 2)) * 0.8
         
-        data_points = np.vstack([cluster1, cluster2, cluster3])
+        # Create dots for data points (the axes map is affine, so map all points at once)
+        origin = axes.coords_to_point(0, 0)
+        ex = axes.coords_to_point(1, 0) - origin
+        ey = axes.coords_to_point(0, 1) - origin
+        positions = origin + data_points[:, 0:1] * ex + data_points[:, 1:2] * ey
+        data_dots = VGroup(*[Dot(position, color=WHITE, radius=0.05) for position in positions])
         
-        # Create dots for data points
-        data_dots = VGroup()
-        for point in data_points:
-            dot = Dot(axes.coords_to_point(point[0], point[1]), color=WHITE, radius=0.05)
-            data_dots.add(dot)
-        
-        self.play(*[FadeIn(dot, scale=0.5) for dot in data_dots])
+        self.play(AnimationGroup(*[FadeIn(dot, scale=0.5) for dot in data_dots], lag_ratio=0, run_time=1.0))
         
         # Initialize 3 random cluster centers
         k = 3
         center_colors = [RED, BLUE, GREEN]
+        center_color_array = np.array(center_colors, dtype=object) # Gathered with an array of cluster ids
         
         # Initial centers (somewhat random but not too bad)
         initial_centers = np.array([[1, 2], [3, 4], [5, 2]])
         
-        center_markers = VGroup()
-        for i, center in enumerate(initial_centers):
-            marker = RegularPolygon(n=4, color=center_colors[i], fill_opacity=1, stroke_width=3)
-            marker.scale(0.2).move_to(axes.coords_to_point(center[0], center[1]))
-            center_markers.add(marker)
+        marker_template = RegularPolygon(n=4, fill_opacity=1, stroke_width=3).scale(0.2)
+        center_markers = VGroup(*[
+            marker_template.copy().set_color(center_colors[i]).move_to(axes.coords_to_point(center[0], center[1]))
+            for i, center in enumerate(initial_centers)
+        ])
         
         self.play(*[FadeIn(marker, scale=1.5) for marker in center_markers])
         
@@ -144,69 +180,70 @@ class KMeansElbowAnimation(Scene):
         self.wait(1)
         
         # Show WCSS tracker
-        wcss_text = Text("WCSS: calculating...", font_size=16, color=YELLOW)
+        # The label is shaped once; only the number changes between iterations
+        wcss_label = Text("WCSS:", font_size=16, color=YELLOW)
+        wcss_num = DecimalNumber(0, num_decimal_places=1, font_size=16, color=YELLOW)
+        wcss_text = VGroup(wcss_label, wcss_num).arrange(RIGHT, buff=0.15)
         wcss_text.next_to(axes, UP, buff=0.3)
         self.play(Write(wcss_text))
         
-        # Simulate a few iterations
-        current_centers = initial_centers.copy()
+        # Simulate a few iterations up front, then replay them
+        n_iter = 3
+        centers_t, assignments_t, wcss_t = _simulate_lloyd(data_points, initial_centers, n_iter)
         
-        for iteration in range(3):
+        for iteration in range(n_iter):
             self.play(Write(process_steps[1]))
             
             # Assign points to clusters (color them)
-            assignments = []
-            wcss_value = 0
+            assignments = assignments_t[iteration]
+            wcss_value = wcss_t[iteration]
             
-            for i, dot in enumerate(data_dots):
-                point = data_points[i]
-                # Calculate distances to each center
-                distances = [np.linalg.norm(point - center) for center in current_centers]
-                closest_cluster = np.argmin(distances)
-                assignments.append(closest_cluster)
-                
-                # Color the point
-                dot.set_color(center_colors[closest_cluster])
-                wcss_value += min(distances) ** 2
+            # Assignments cover every point, but (as in mini-batch k-means) only a
+            # batch of 20 dots is animated; the others take their color directly
+            in_batch = np.zeros(len(data_points), dtype=bool)
+            in_batch[rng.choice(len(data_points), 20, replace=False)] = True
+            rest = np.flatnonzero(~in_batch)
+            for i, color in zip(rest, center_color_array[assignments[rest]]):
+                data_dots[i].set_color(color)
             
-            self.play(*[Indicate(dot, color=dot.color) for dot in data_dots], run_time=1.5)
+            # Sort once by cluster so each cluster is a contiguous slice of `order`
+            order = np.argsort(assignments, kind="stable")
+            boundaries = np.searchsorted(assignments[order], np.arange(k + 1))
+            cluster_groups = [
+                VGroup(*[data_dots[i] for i in order[boundaries[cluster_id]:boundaries[cluster_id + 1]] if in_batch[i]])
+                for cluster_id in range(k)
+            ]
+            self.play(
+                *[group.animate.set_color(center_colors[cluster_id]) for cluster_id, group in enumerate(cluster_groups)],
+                run_time=1.5
+            )
             
             # Update WCSS display
-            wcss_display = Text(f"WCSS: {wcss_value:.1f}", font_size=16, color=YELLOW)
-            wcss_display.move_to(wcss_text.get_center())
-            self.play(Transform(wcss_text, wcss_display))
+            self.play(ChangeDecimalToValue(wcss_num, wcss_value))
             
             self.play(Write(process_steps[2]))
             
-            # Update cluster centers
-            new_centers = []
-            for cluster_id in range(k):
-                cluster_points = data_points[np.array(assignments) == cluster_id]
-                if len(cluster_points) > 0:
-                    new_center = np.mean(cluster_points, axis=0)
-                    new_centers.append(new_center)
-                    
-                    # Animate center movement
-                    new_pos = axes.coords_to_point(new_center[0], new_center[1])
-                    self.play(center_markers[cluster_id].animate.move_to(new_pos))
-                else:
-                    new_centers.append(current_centers[cluster_id])
+            # Animate center movement (centers of empty clusters stay put)
+            new_centers = centers_t[iteration + 1]
+            moved = np.flatnonzero((new_centers != centers_t[iteration]).any(axis=1))
+            new_positions = axes.coords_to_point(new_centers[:, 0], new_centers[:, 1]).T
+            if len(moved) > 0:
+                self.play(
+                    *[center_markers[cluster_id].animate.move_to(new_positions[cluster_id]) for cluster_id in moved],
+                    run_time=1.0
+                )
             
-            current_centers = np.array(new_centers)
             self.wait(1)
         
         self.play(Write(process_steps[3]))
         
         # Final assignment and WCSS
-        final_wcss = 0
-        for i, dot in enumerate(data_dots):
-            point = data_points[i]
-            distances = [np.linalg.norm(point - center) for center in current_centers]
-            final_wcss += min(distances) ** 2
+        final_wcss = wcss_t[-1]
         
-        final_wcss_display = Text(f"Final WCSS: {final_wcss:.1f}", font_size=16, color=GREEN, weight=BOLD)
-        final_wcss_display.move_to(wcss_text.get_center())
-        self.play(Transform(wcss_text, final_wcss_display))
+        final_wcss_label = Text("Final WCSS:", font_size=16, color=GREEN, weight=BOLD)
+        final_wcss_label.next_to(wcss_num, LEFT, buff=0.15)
+        wcss_num.set_color(GREEN)
+        self.play(Transform(wcss_label, final_wcss_label), ChangeDecimalToValue(wcss_num, final_wcss))
         
         self.wait(2)
         
@@ -235,8 +272,8 @@ class KMeansElbowAnimation(Scene):
             axis_config={"stroke_color": WHITE, "stroke_width": 2}
         ).move_to(ORIGIN)
         
-        elbow_x_label = Text("Number of Clusters (k)", font_size=16, color=WHITE).next_to(elbow_axes, DOWN)
-        elbow_y_label = Text("WCSS", font_size=16, color=WHITE).next_to(elbow_axes, LEFT).rotate(PI/2)
+        elbow_x_label = _text("Number of Clusters (k)").next_to(elbow_axes, DOWN)
+        elbow_y_label = _text("WCSS").next_to(elbow_axes, LEFT).rotate(PI/2)
         
         self.play(Create(elbow_axes), Write(elbow_x_label), Write(elbow_y_label))
         
@@ -245,41 +282,41 @@ class KMeansElbowAnimation(Scene):
         wcss_values = np.array([95, 45, 25, 20, 18, 17, 16.5])  # Typical elbow pattern
         
         # Plot points and curve
-        elbow_points = VGroup()
-        plot_coords = []
-        
-        for i, (k, wcss) in enumerate(zip(k_values, wcss_values)):
-            coord = elbow_axes.coords_to_point(k, wcss)
-            plot_coords.append(coord)
-            point = Dot(coord, color=YELLOW, radius=0.08)
-            elbow_points.add(point)
+        origin = elbow_axes.coords_to_point(0, 0)
+        ex = elbow_axes.coords_to_point(1, 0) - origin
+        ey = elbow_axes.coords_to_point(0, 1) - origin
+        plot_coords = origin + k_values[:, None] * ex + wcss_values[:, None] * ey
+        elbow_points = VGroup(*[Dot(coord, color=YELLOW, radius=0.08) for coord in plot_coords])
         
-        # Create smooth curve
+        # Piecewise-linear curve through the 7 points (no smoothing solve needed)
         elbow_curve = VMobject(color=BLUE, stroke_width=4)
-        elbow_curve.set_points_smoothly(plot_coords)
+        elbow_curve.set_points_as_corners(plot_coords)
         
         self.play(Create(elbow_curve))
-        self.play(*[FadeIn(point, scale=1.2) for point in elbow_points])
+        self.play(AnimationGroup(*[FadeIn(point, scale=1.2) for point in elbow_points], lag_ratio=0, run_time=1.0))
         
         # Highlight the elbow point (k=3)
         elbow_point = elbow_points[2]  # k=3
         elbow_highlight = Circle(radius=0.2, color=RED, stroke_width=4)
         elbow_highlight.move_to(elbow_point.get_center())
+        # The highlight never moves, so read its anchor points once
+        highlight_top = elbow_highlight.get_top()
+        explanation_corner = elbow_highlight.get_corner(UR) + 0.5 * (UP + RIGHT)
         
         self.play(Create(elbow_highlight))
         
         # Add explanation
         elbow_explanation = VGroup(
             Text("The 'Elbow':", font_size=20, color=RED, weight=BOLD),
-            Text("Point where WCSS reduction", font_size=16, color=WHITE),
-            Text("starts to level off", font_size=16, color=WHITE),
+            _text("Point where WCSS reduction"),
+            _text("starts to level off"),
             Text("k = 3 is optimal here", font_size=16, color=GREEN, weight=BOLD)
-        ).arrange(DOWN, buff=0.2).next_to(elbow_highlight, UP+RIGHT, buff=0.5)
+        ).arrange(DOWN, buff=0.2).move_to(explanation_corner, aligned_edge=DL)
         
         # Draw arrow pointing to elbow
         elbow_arrow = Arrow(
             elbow_explanation.get_bottom(),
-            elbow_highlight.get_top(),
+            highlight_top,
             stroke_width=3,
             color=RED,
             max_tip_length_to_length_ratio=0.1
@@ -327,39 +364,33 @@ class KMeansElbowAnimation(Scene):
             
             VGroup(
                 Text("1. Elbow Method", font_size=20, color=BLUE, weight=BOLD),
-                Text("• Find the 'elbow' in WCSS vs k plot", font_size=16, color=WHITE),
-                Text("• Point of diminishing returns", font_size=16, color=WHITE)
+                _text("• Find the 'elbow' in WCSS vs k plot"),
+                _text("• Point of diminishing returns")
             ).arrange(DOWN, aligned_edge=LEFT, buff=0.2),
             
             VGroup(
                 Text("2. Silhouette Analysis", font_size=20, color=GREEN, weight=BOLD),
-                Text("• Measure how well points fit their clusters", font_size=16, color=WHITE),
-                Text("• Higher silhouette score = better clustering", font_size=16, color=WHITE)
+                _text("• Measure how well points fit their clusters"),
+                _text("• Higher silhouette score = better clustering")
             ).arrange(DOWN, aligned_edge=LEFT, buff=0.2),
             
             VGroup(
                 Text("3. Domain Knowledge", font_size=20, color=PURPLE, weight=BOLD),
-                Text("• Use business/scientific understanding", font_size=16, color=WHITE),
-                Text("• Consider interpretability needs", font_size=16, color=WHITE)
+                _text("• Use business/scientific understanding"),
+                _text("• Consider interpretability needs")
             ).arrange(DOWN, aligned_edge=LEFT, buff=0.2),
             
             VGroup(
                 Text("4. Gap Statistic", font_size=20, color=ORANGE, weight=BOLD),
-                Text("• Compare clustering to random data", font_size=16, color=WHITE),
-                Text("• More rigorous statistical approach", font_size=16, color=WHITE)
+                _text("• Compare clustering to random data"),
+                _text("• More rigorous statistical approach")
             ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         ).arrange(DOWN, buff=0.6).move_to(ORIGIN)
         
         # Show methods progressively
-        for method in methods:
-            if isinstance(method, VGroup) and len(method) > 1:
-                self.play(Write(method[0]))
-                for sub_item in method[1:]:
-                    self.play(Write(sub_item))
-                    self.wait(0.5)
-            else:
-                self.play(Write(method))
-            self.wait(0.8)
+        all_lines = [methods[0]] + [line for method in methods[1:] for line in method]
+        self.play(LaggedStart(*[Write(line) for line in all_lines], lag_ratio=0.25, run_time=6))
+        self.wait(0.8)
         
         # Highlight elbow method as most common
         elbow_highlight_box = SurroundingRectangle(
@@ -384,45 +415,57 @@ class KMeansElbowAnimation(Scene):
         self.play(ReplacementTransform(self.optimal_title, summary_title))
         
         # Create comprehensive summary
-        summary_card = RoundedRectangle(
-            corner_radius=0.2, width=12, height=5,
-            stroke_color=WHITE, stroke_width=2,
-            fill_color=BLACK, fill_opacity=0.95
-        ).move_to(ORIGIN)
-        
-        summary_content = VGroup(
-            VGroup(
+        summary_sections = [
+            [
                 Text("🔄 Algorithm:", font_size=20, color=BLUE, weight=BOLD),
-                Text("1. Initialize k cluster centers randomly", font_size=16, color=WHITE),
-                Text("2. Assign each point to nearest center", font_size=16, color=WHITE),
-                Text("3. Update centers to cluster means", font_size=16, color=WHITE),
-                Text("4. Repeat until convergence", font_size=16, color=WHITE)
-            ).arrange(DOWN, aligned_edge=LEFT, buff=0.2),
+                _text("1. Initialize k cluster centers randomly"),
+                _text("2. Assign each point to nearest center"),
+                _text("3. Update centers to cluster means"),
+                _text("4. Repeat until convergence")
+            ],
             
-            VGroup(
+            [
                 Text("📊 Choosing k:", font_size=20, color=GREEN, weight=BOLD),
-                Text("• Elbow method: find WCSS 'elbow'", font_size=16, color=WHITE),
-                Text("• Look for diminishing returns", font_size=16, color=WHITE),
-                Text("• Balance complexity vs performance", font_size=16, color=WHITE)
-            ).arrange(DOWN, aligned_edge=LEFT, buff=0.2),
+                _text("• Elbow method: find WCSS 'elbow'"),
+                _text("• Look for diminishing returns"),
+                _text("• Balance complexity vs performance")
+            ],
             
-            VGroup(
+            [
                 Text("⚡ Key Points:", font_size=20, color=ORANGE, weight=BOLD),
-                Text("• Minimizes Within-Cluster Sum of Squares", font_size=16, color=WHITE),
-                Text("• Works best with spherical clusters", font_size=16, color=WHITE),
-                Text("• Sensitive to initialization and outliers", font_size=16, color=WHITE)
-            ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
-        ).arrange(DOWN, buff=0.6).move_to(summary_card.get_center())
+                _text("• Minimizes Within-Cluster Sum of Squares"),
+                _text("• Works best with spherical clusters"),
+                _text("• Sensitive to initialization and outliers")
+            ]
+        ]
+        
+        # Lay every line out top to bottom in one pass (lines left-aligned within a
+        # section, sections centered, block centered on ORIGIN) instead of nested
+        # arrange() calls followed by move_to()
+        line_buff, section_buff = 0.2, 0.6
+        y = (
+            sum(line.height for section in summary_sections for line in section)
+            + line_buff * sum(len(section) - 1 for section in summary_sections)
+            + section_buff * (len(summary_sections) - 1)
+        ) / 2
+        for section in summary_sections:
+            left = -max(line.width for line in section) / 2
+            for line in section:
+                line.move_to([left, y, 0], aligned_edge=UL)
+                y -= line.height + line_buff
+            y += line_buff - section_buff
+        summary_content = VGroup(*[VGroup(*section) for section in summary_sections])
+        summary_card = BackgroundRectangle(
+            summary_content, color=BLACK, fill_opacity=0.95,
+            stroke_color=WHITE, stroke_width=2, stroke_opacity=1, buff=0.4
+        )
         
         self.play(FadeIn(summary_card))
         
         # Animate summary sections
-        for section in summary_content:
-            self.play(Write(section[0]))
-            for item in section[1:]:
-                self.play(Write(item))
-                self.wait(0.4)
-            self.wait(0.8)
+        all_lines = [line for section in summary_content for line in section]
+        self.play(LaggedStart(*[Write(line) for line in all_lines], lag_ratio=0.25, run_time=6))
+        self.wait(0.8)
         
         # Final message
         final_message = Text(
@@ -430,7 +473,7 @@ class KMeansElbowAnimation(Scene):
             font_size=20,
             color=YELLOW,
             weight=BOLD
-        ).next_to(summary_card, DOWN, buff=0.8)
+        ).move_to(summary_card.get_bottom() + DOWN * 0.8, aligned_edge=UP)
         
         self.play(Write(final_message))
         self.wait(3)
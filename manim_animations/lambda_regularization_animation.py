@@ -7,10 +7,18 @@ Focus on movement and visual effects
 
 from manim import *
 import numpy as np
+from text_cache import cached_text as _text
+
+_RNG = np.random.default_rng(0)
 
 class LambdaRegularizationAnimation(Scene):
     def construct(self):
         self.camera.background_color = "#1E1E1E"
+        self._basis_cache = {}
+        # One Axes carried across the plotting sections, retargeted as needed
+        self._axes = None
+        self._axes_key = None
+        self._axes_labels = None
         
         # Show coefficient shrinkage
         self.show_coefficient_shrinkage()
@@ -27,14 +35,57 @@ class LambdaRegularizationAnimation(Scene):
         # Show final comparison
         self.show_final_comparison()
     
+    def _axes_basis(self, axes):
+        """Origin and unit steps of an axes' affine c2p map, computed once per axes"""
+        # Keyed on the axes itself rather than id(axes) so a collected axes'
+        # id can never be reused by a later section's axes
+        if axes not in self._basis_cache:
+            origin = axes.c2p(0, 0)
+            self._basis_cache[axes] = (origin, axes.c2p(1, 0) - origin, axes.c2p(0, 1) - origin)
+        return self._basis_cache[axes]
+
+    def c2p_batch(self, axes, xs, ys):
+        """Map arrays of graph coordinates to scene points in three NumPy ops"""
+        origin, xu, yu = self._axes_basis(axes)
+        return origin + np.asarray(xs)[:, None] * xu + np.asarray(ys)[:, None] * yu
+
+    def _show_axes(self, x_range, y_range, x_length, y_length, x_text, y_text, x_font_size=16):
+        """Bring in the shared axes for a section, rebuilding them only when the ranges change"""
+        key = (tuple(x_range), tuple(y_range), x_length, y_length)
+        axes = self._axes
+        if key != self._axes_key:
+            axes = Axes(
+                x_range=x_range,
+                y_range=y_range,
+                x_length=x_length,
+                y_length=y_length,
+                axis_config={"stroke_color": WHITE, "stroke_width": 2}
+            ).move_to(ORIGIN)
+        
+        x_label = _text(x_text, font_size=x_font_size, color=WHITE).next_to(axes, DOWN)
+        y_label = _text(y_text, font_size=16, color=WHITE).next_to(axes, LEFT).rotate(PI/2)
+        labels = VGroup(x_label, y_label)
+        
+        if self._axes is None:
+            self.play(Create(axes), Write(labels))
+        elif axes is self._axes:
+            self.play(ReplacementTransform(self._axes_labels, labels))
+        else:
+            # ReplacementTransform so the new axes' coordinate system is the one kept
+            self.play(ReplacementTransform(self._axes, axes), ReplacementTransform(self._axes_labels, labels))
+        
+        self._axes, self._axes_key, self._axes_labels = axes, key, labels
+        return axes
+    
     def show_coefficient_shrinkage(self):
         """Show how lambda shrinks coefficients"""
-        title = Text("λ Controls Coefficient Shrinkage", font_size=32, color=YELLOW, weight=BOLD).to_edge(UP)
+        title = _text("λ Controls Coefficient Shrinkage", font_size=32, color=YELLOW, weight=BOLD).to_edge(UP)
         self.play(Write(title))
         
         # Create coefficient bars for different features
         feature_names = ["Feature 1", "Feature 2", "Feature 3", "Feature 4", "Feature 5"]
-        original_coeffs = [2.5, -1.8, 3.2, -0.9, 1.6]  # Original coefficients
+        original_coeffs = np.array([2.5, -1.8, 3.2, -0.9, 1.6])  # Original coefficients
+        bar_x = -4 + 1.8 * np.arange(len(original_coeffs))  # Bar centers along x
         
         # Create bars
         bars = VGroup()
@@ -56,9 +107,14 @@ class LambdaRegularizationAnimation(Scene):
             else:
                 bar.shift(UP*coeff/2)
             
-            # Label
-            label = Text(f"{name}\n{coeff:.1f}", font_size=12, color=WHITE)
+            # Label: the name is shaped once and only the value changes with λ.
+            # The label follows its bar as the bar is resized.
+            label = VGroup(
+                _text(name, font_size=12, color=WHITE),
+                DecimalNumber(coeff, num_decimal_places=1, font_size=12, color=WHITE)
+            ).arrange(DOWN, buff=0.1)
             label.next_to(bar, DOWN, buff=0.3)
+            label.add_updater(lambda m, bar=bar: m.next_to(bar, DOWN, buff=0.3))
             
             bars.add(bar)
             labels.add(label)
@@ -74,130 +130,117 @@ class LambdaRegularizationAnimation(Scene):
         lambda_knob = Circle(radius=0.2, fill_color=ORANGE, fill_opacity=1, stroke_color=WHITE)
         lambda_knob.move_to(lambda_slider.get_left() + RIGHT*0.5)
         
-        lambda_text = Text("λ = 0.0", font_size=18, color=ORANGE, weight=BOLD)
-        lambda_text.next_to(lambda_slider, DOWN, buff=0.3)
+        # Shape "λ = " once; only the number changes as λ grows
+        lambda_num = DecimalNumber(0.0, num_decimal_places=1, font_size=18, color=ORANGE)
+        lambda_group = VGroup(_text("λ = ", font_size=18, color=ORANGE, weight=BOLD), lambda_num)
+        lambda_group.arrange(RIGHT, buff=0.05).next_to(lambda_slider, DOWN, buff=0.3)
         
-        self.play(Create(lambda_slider), FadeIn(lambda_knob), Write(lambda_text))
+        self.play(Create(lambda_slider), FadeIn(lambda_knob), Write(lambda_group))
         
         # Show shrinkage as lambda increases
         lambda_values = [0.0, 0.5, 1.0, 2.0, 5.0]
+        bar_signs = np.sign(original_coeffs)
+        prev_lambda, prev_coeffs = lambda_values[0], original_coeffs
         
+        # Build every step up front and play them back to back in one Succession.
+        # The decimals interpolate from explicit start values since each step is
+        # constructed before the previous one has run.
+        steps = []
         for lambda_val in lambda_values[1:]:
             # Move slider knob
             new_knob_pos = lambda_slider.get_left() + RIGHT*(lambda_val/5.0 * 7 + 0.5)
             
-            # Calculate shrunk coefficients
-            shrunk_coeffs = [coeff/(1 + lambda_val) for coeff in original_coeffs]
-            
-            # Create new bars
-            new_bars = VGroup()
-            new_labels = VGroup()
-            
-            for i, (name, orig_coeff, shrunk_coeff) in enumerate(zip(feature_names, original_coeffs, shrunk_coeffs)):
-                new_bar = Rectangle(
-                    width=0.8,
-                    height=abs(shrunk_coeff),
-                    fill_color=BLUE if shrunk_coeff > 0 else RED,
-                    fill_opacity=0.8,
-                    stroke_color=WHITE,
-                    stroke_width=2
-                )
-                new_bar.move_to(LEFT*4 + RIGHT*i*1.8 + UP*0.5)
-                if shrunk_coeff < 0:
-                    new_bar.shift(DOWN*abs(shrunk_coeff)/2)
-                else:
-                    new_bar.shift(UP*shrunk_coeff/2)
-                
-                new_label = Text(f"{name}\n{shrunk_coeff:.1f}", font_size=12, color=WHITE)
-                new_label.next_to(new_bar, DOWN, buff=0.3)
-                
-                new_bars.add(new_bar)
-                new_labels.add(new_label)
+            # Calculate shrunk coefficients and the resulting bar geometry in one pass
+            shrunk_coeffs = original_coeffs / (1 + lambda_val)
+            heights = np.abs(shrunk_coeffs)
+            centers_y = 0.5 + np.where(shrunk_coeffs < 0, -heights / 2, heights / 2)
             
-            # Update lambda text
-            new_lambda_text = Text(f"λ = {lambda_val:.1f}", font_size=18, color=ORANGE, weight=BOLD)
-            new_lambda_text.next_to(lambda_slider, DOWN, buff=0.3)
+            # Resize the existing bars in place; recolor only bars whose sign flipped
+            bar_anims = []
+            for i, bar in enumerate(bars):
+                bar_anim = bar.animate.stretch_to_fit_height(heights[i]).move_to([bar_x[i], centers_y[i], 0])
+                if (shrunk_coeffs[i] > 0) != (bar_signs[i] > 0):
+                    bar_anim = bar_anim.set_fill(BLUE if shrunk_coeffs[i] > 0 else RED)
+                bar_anims.append(bar_anim)
+            bar_signs = np.sign(shrunk_coeffs)
             
-            # Animate changes
-            self.play(
-                lambda_knob.animate.move_to(new_knob_pos),
-                ReplacementTransform(lambda_text, new_lambda_text),
-                *[Transform(bars[i], new_bars[i]) for i in range(len(bars))],
-                *[Transform(labels[i], new_labels[i]) for i in range(len(labels))],
-                run_time=1
-            )
-            
-            lambda_text = new_lambda_text
-            self.wait(0.5)
+            steps.append(Succession(
+                AnimationGroup(
+                    lambda_knob.animate.move_to(new_knob_pos),
+                    ChangingDecimal(lambda_num, lambda a, s=prev_lambda, e=lambda_val: interpolate(s, e, a)),
+                    *bar_anims,
+                    *[
+                        ChangingDecimal(labels[i][1], lambda a, s=prev_coeffs[i], e=shrunk_coeffs[i]: interpolate(s, e, a))
+                        for i in range(len(labels))
+                    ],
+                    run_time=1
+                ),
+                Wait(0.5)
+            ))
+            prev_lambda, prev_coeffs = lambda_val, shrunk_coeffs
+        
+        self.play(Succession(*steps))
+        # The bars are done moving, so the labels no longer need to follow them
+        for label in labels:
+            label.clear_updaters()
         
         # Add shrinkage arrows
-        shrinkage_arrows = VGroup()
-        for i in range(len(bars)):
-            arrow = Arrow(
-                bars[i].get_top() + UP*0.3,
-                bars[i].get_center(),
-                color=YELLOW,
-                stroke_width=3,
-                max_tip_length_to_length_ratio=0.3
-            )
-            shrinkage_arrows.add(arrow)
+        # Every arrow is the same shape, so build the tip geometry once and copy it
+        arrow_template = Arrow(
+            UP*0.5,
+            ORIGIN,
+            buff=0,
+            color=YELLOW,
+            stroke_width=3,
+            max_tip_length_to_length_ratio=0.3
+        )
+        shrinkage_arrows = VGroup(*[arrow_template.copy().next_to(bar, UP, buff=0.05) for bar in bars])
         
-        shrinkage_text = Text("Shrinkage!", font_size=20, color=YELLOW, weight=BOLD)
+        shrinkage_text = _text("Shrinkage!", font_size=20, color=YELLOW, weight=BOLD)
         shrinkage_text.next_to(shrinkage_arrows, UP, buff=0.5)
         
         self.play(*[GrowArrow(arrow) for arrow in shrinkage_arrows], Write(shrinkage_text))
         
         self.wait(2)
         self.play(FadeOut(VGroup(
-            bars, labels, lambda_slider, lambda_knob, lambda_text, 
+            bars, labels, lambda_slider, lambda_knob, lambda_group, 
             shrinkage_arrows, shrinkage_text
         )))
         self.shrinkage_title = title
     
     def show_bias_variance_tradeoff(self):
         """Show bias-variance tradeoff with lambda"""
-        tradeoff_title = Text("λ Controls Bias-Variance Tradeoff", font_size=28, color=PURPLE, weight=BOLD).to_edge(UP)
+        tradeoff_title = _text("λ Controls Bias-Variance Tradeoff", font_size=28, color=PURPLE, weight=BOLD).to_edge(UP)
         self.play(ReplacementTransform(self.shrinkage_title, tradeoff_title))
         
         # Create axes
-        axes = Axes(
-            x_range=[0, 5, 1],
-            y_range=[0, 3, 0.5],
-            x_length=8,
-            y_length=5,
-            axis_config={"stroke_color": WHITE, "stroke_width": 2}
-        ).move_to(ORIGIN)
-        
-        x_label = Text("λ (Regularization)", font_size=16, color=WHITE).next_to(axes, DOWN)
-        y_label = Text("Error", font_size=16, color=WHITE).next_to(axes, LEFT).rotate(PI/2)
-        
-        self.play(Create(axes), Write(x_label), Write(y_label))
+        axes = self._show_axes([0, 5, 1], [0, 3, 0.5], 8, 5, "λ (Regularization)", "Error")
         
         # Create bias and variance curves
         lambda_vals = np.linspace(0.1, 4.5, 50)
         
         # Bias increases with lambda (model becomes simpler)
         bias_vals = 0.3 + 0.4 * lambda_vals
-        bias_points = [axes.coords_to_point(x, y) for x, y in zip(lambda_vals, bias_vals)]
+        bias_points = self.c2p_batch(axes, lambda_vals, bias_vals)
         bias_curve = VMobject(color=RED, stroke_width=4)
         bias_curve.set_points_smoothly(bias_points)
         
         # Variance decreases with lambda (less overfitting)
         variance_vals = 2.5 * np.exp(-lambda_vals) + 0.2
-        variance_points = [axes.coords_to_point(x, y) for x, y in zip(lambda_vals, variance_vals)]
+        variance_points = self.c2p_batch(axes, lambda_vals, variance_vals)
         variance_curve = VMobject(color=BLUE, stroke_width=4)
         variance_curve.set_points_smoothly(variance_points)
         
         # Total error (bias + variance)
         total_vals = bias_vals + variance_vals
-        total_points = [axes.coords_to_point(x, y) for x, y in zip(lambda_vals, total_vals)]
+        total_points = self.c2p_batch(axes, lambda_vals, total_vals)
         total_curve = VMobject(color=GREEN, stroke_width=4)
         total_curve.set_points_smoothly(total_points)
         
         # Animate curves appearing
-        bias_label = Text("Bias²", font_size=16, color=RED, weight=BOLD).move_to(axes.coords_to_point(4, 2))
-        variance_label = Text("Variance", font_size=16, color=BLUE, weight=BOLD).move_to(axes.coords_to_point(0.5, 2.2))
-        total_label = Text("Total Error", font_size=16, color=GREEN, weight=BOLD).move_to(axes.coords_to_point(2, 2.5))
+        bias_label = _text("Bias²", font_size=16, color=RED, weight=BOLD).move_to(axes.coords_to_point(4, 2))
+        variance_label = _text("Variance", font_size=16, color=BLUE, weight=BOLD).move_to(axes.coords_to_point(0.5, 2.2))
+        total_label = _text("Total Error", font_size=16, color=GREEN, weight=BOLD).move_to(axes.coords_to_point(2, 2.5))
         
         self.play(Create(variance_curve), Write(variance_label))
         self.wait(0.5)
@@ -213,7 +256,7 @@ class LambdaRegularizationAnimation(Scene):
             color=YELLOW,
             stroke_width=3
         )
-        optimal_text = Text("Optimal λ", font_size=14, color=YELLOW, weight=BOLD)
+        optimal_text = _text("Optimal λ", font_size=14, color=YELLOW, weight=BOLD)
         optimal_text.next_to(optimal_line, UP, buff=0.2)
         
         self.play(Create(optimal_line), Write(optimal_text))
@@ -225,14 +268,14 @@ class LambdaRegularizationAnimation(Scene):
             color=WHITE,
             stroke_width=2
         )
-        lambda_arrow_text = Text("Increasing λ", font_size=14, color=WHITE)
+        lambda_arrow_text = _text("Increasing λ", font_size=14, color=WHITE)
         lambda_arrow_text.next_to(lambda_arrow, DOWN, buff=0.1)
         
         self.play(GrowArrow(lambda_arrow), Write(lambda_arrow_text))
         
         self.wait(2)
         self.play(FadeOut(VGroup(
-            axes, x_label, y_label, bias_curve, variance_curve, total_curve,
+            bias_curve, variance_curve, total_curve,
             bias_label, variance_label, total_label, optimal_line, optimal_text,
             lambda_arrow, lambda_arrow_text
         )))
@@ -240,7 +283,7 @@ class LambdaRegularizationAnimation(Scene):
     
     def show_feature_selection(self):
         """Show feature selection with elastic net"""
-        selection_title = Text("Feature Selection: Coefficients → 0", font_size=28, color=ORANGE, weight=BOLD).to_edge(UP)
+        selection_title = _text("Feature Selection: Coefficients → 0", font_size=28, color=ORANGE, weight=BOLD).to_edge(UP)
         self.play(ReplacementTransform(self.tradeoff_title, selection_title))
         
         # Create coefficient paths as lambda increases
@@ -249,47 +292,38 @@ class LambdaRegularizationAnimation(Scene):
         
         # Simulate coefficient paths (some go to zero, others shrink)
         lambda_range = np.linspace(0, 3, 100)
-        coefficient_paths = [
+        coefficient_paths = np.stack([
             2.5 * np.exp(-lambda_range * 0.5),  # Feature A: shrinks slowly
             -1.8 * np.exp(-lambda_range * 2),   # Feature B: shrinks fast to zero
             3.0 * np.maximum(0, 1 - lambda_range),  # Feature C: hits zero at λ=1
             -0.9 * np.exp(-lambda_range * 1.5),     # Feature D: shrinks to zero
             1.6 * np.exp(-lambda_range * 0.3)      # Feature E: shrinks slowly
-        ]
-        
-        # Create axes
-        axes = Axes(
-            x_range=[0, 3, 0.5],
-            y_range=[-2, 3, 1],
-            x_length=10,
-            y_length=6,
-            axis_config={"stroke_color": WHITE, "stroke_width": 2}
-        ).move_to(ORIGIN)
+        ])
         
-        x_label = Text("λ", font_size=18, color=WHITE).next_to(axes, DOWN)
-        y_label = Text("Coefficient Value", font_size=16, color=WHITE).next_to(axes, LEFT).rotate(PI/2)
-        
-        self.play(Create(axes), Write(x_label), Write(y_label))
+        # Retarget the shared axes
+        axes = self._show_axes([0, 3, 0.5], [-2, 3, 1], 10, 6, "λ", "Coefficient Value", x_font_size=18)
         
         # Draw coefficient paths
         paths = VGroup()
         path_labels = VGroup()
         
-        for i, (feature, color, path_values) in enumerate(zip(features, colors, coefficient_paths)):
-            points = [axes.coords_to_point(lam, coeff) for lam, coeff in zip(lambda_range, path_values)]
+        # Map all 5 x 100 path points to the scene in one call
+        lambda_grid = np.broadcast_to(lambda_range, coefficient_paths.shape)
+        path_points = self.c2p_batch(axes, lambda_grid.ravel(), coefficient_paths.ravel()).reshape(*coefficient_paths.shape, 3)
+        
+        for i, (feature, color, points) in enumerate(zip(features, colors, path_points)):
             path = VMobject(color=color, stroke_width=3)
             path.set_points_smoothly(points)
             paths.add(path)
             
             # Label at the end
             final_point = points[-1]
-            label = Text(feature, font_size=12, color=color, weight=BOLD)
+            label = _text(feature, font_size=12, color=color, weight=BOLD)
             label.next_to(final_point, RIGHT, buff=0.1)
             path_labels.add(label)
         
         # Animate paths being drawn
-        for path, label in zip(paths, path_labels):
-            self.play(Create(path), Write(label), run_time=0.8)
+        self.play(*[Create(path) for path in paths], *[Write(label) for label in path_labels], run_time=1.6)
         
         # Add zero line
         zero_line = DashedLine(
@@ -303,52 +337,39 @@ class LambdaRegularizationAnimation(Scene):
         
         # Highlight features that go to zero
         zero_features = [1, 2, 3]  # Features B, C, D go to zero
-        for idx in zero_features:
-            highlight_circle = Circle(
-                radius=0.2,
-                color=YELLOW,
-                stroke_width=3,
-                fill_opacity=0
-            ).move_to(axes.coords_to_point(3, 0))
-            
-            self.play(FadeIn(highlight_circle, scale=0.5))
-            self.wait(0.3)
-            self.play(FadeOut(highlight_circle))
+        highlight_circle = Circle(
+            radius=0.2,
+            color=YELLOW,
+            stroke_width=3,
+            fill_opacity=0
+        ).move_to(axes.coords_to_point(3, 0))
+        # One pulse per play; chained in a single Succession every circle would show from the first frame
+        for _ in zero_features:
+            self.play(Succession(FadeIn(highlight_circle, scale=0.5), Wait(0.3), FadeOut(highlight_circle)))
         
         # Add selection text
-        selection_text = Text("Some coefficients shrink to ZERO!", font_size=18, color=YELLOW, weight=BOLD)
+        selection_text = _text("Some coefficients shrink to ZERO!", font_size=18, color=YELLOW, weight=BOLD)
         selection_text.next_to(axes, UP, buff=0.5)
         self.play(Write(selection_text))
         
         self.wait(2)
         self.play(FadeOut(VGroup(
-            axes, x_label, y_label, paths, path_labels, zero_line, selection_text
+            paths, path_labels, zero_line, selection_text
         )))
         self.selection_title = selection_title
     
     def show_cv_tuning(self):
         """Show cross-validation tuning process"""
-        cv_title = Text("Cross-Validation Tuning", font_size=28, color=TEAL, weight=BOLD).to_edge(UP)
+        cv_title = _text("Cross-Validation Tuning", font_size=28, color=TEAL, weight=BOLD).to_edge(UP)
         self.play(ReplacementTransform(self.selection_title, cv_title))
         
-        # Create CV error curve
-        axes = Axes(
-            x_range=[0, 5, 1],
-            y_range=[0, 2, 0.5],
-            x_length=8,
-            y_length=5,
-            axis_config={"stroke_color": WHITE, "stroke_width": 2}
-        ).move_to(ORIGIN)
-        
-        x_label = Text("λ", font_size=18, color=WHITE).next_to(axes, DOWN)
-        y_label = Text("CV Error", font_size=16, color=WHITE).next_to(axes, LEFT).rotate(PI/2)
-        
-        self.play(Create(axes), Write(x_label), Write(y_label))
+        # Retarget the shared axes for the CV error curve
+        axes = self._show_axes([0, 5, 1], [0, 2, 0.5], 8, 5, "λ", "CV Error", x_font_size=18)
         
         # Create CV error curve (U-shaped)
         lambda_vals = np.linspace(0.1, 4.5, 50)
-        cv_errors = 0.5 + 0.3 * (lambda_vals - 2)**2 + 0.05 * np.random.normal(0, 1, len(lambda_vals))
-        cv_points = [axes.coords_to_point(x, y) for x, y in zip(lambda_vals, cv_errors)]
+        cv_errors = 0.5 + 0.3*(lambda_vals - 2)**2 + 0.05*_RNG.standard_normal(len(lambda_vals))
+        cv_points = self.c2p_batch(axes, lambda_vals, cv_errors)
         
         # Animate CV process with moving dots
         cv_dots = VGroup()
@@ -357,13 +378,12 @@ class LambdaRegularizationAnimation(Scene):
             cv_dots.add(dot)
         
         # Show "testing" process
-        testing_text = Text("Testing different λ values...", font_size=16, color=WHITE)
+        testing_text = _text("Testing different λ values...", font_size=16, color=WHITE)
         testing_text.to_edge(DOWN)
         self.play(Write(testing_text))
         
         # Animate dots appearing
-        for dot in cv_dots:
-            self.play(FadeIn(dot, scale=1.5), run_time=0.1)
+        self.play(LaggedStart(*[FadeIn(dot, scale=1.5) for dot in cv_dots], lag_ratio=0.3), run_time=1.0)
         
         # Draw curve through points
         cv_curve = VMobject(color=BLUE, stroke_width=3)
@@ -379,7 +399,7 @@ class LambdaRegularizationAnimation(Scene):
         min_circle = Circle(radius=0.3, color=GREEN, stroke_width=4, fill_opacity=0)
         min_circle.move_to(min_point)
         
-        optimal_text = Text(f"Optimal λ = {optimal_lambda_cv:.2f}", font_size=16, color=GREEN, weight=BOLD)
+        optimal_text = _text(f"Optimal λ = {optimal_lambda_cv:.2f}", font_size=16, color=GREEN, weight=BOLD)
         optimal_text.next_to(min_circle, UP, buff=0.3)
         
         self.play(
@@ -393,13 +413,13 @@ class LambdaRegularizationAnimation(Scene):
         
         self.wait(2)
         self.play(FadeOut(VGroup(
-            axes, x_label, y_label, cv_dots, cv_curve, min_circle, optimal_text
+            axes, self._axes_labels, cv_dots, cv_curve, min_circle, optimal_text
         )))
         self.cv_title = cv_title
     
     def show_final_comparison(self):
         """Show final comparison of different lambda values"""
-        comparison_title = Text("λ Summary: Regularization Control", font_size=32, color=YELLOW, weight=BOLD).to_edge(UP)
+        comparison_title = _text("λ Summary: Regularization Control", font_size=32, color=YELLOW, weight=BOLD).to_edge(UP)
         self.play(ReplacementTransform(self.cv_title, comparison_title))
         
         # Create three scenarios
@@ -407,50 +427,42 @@ class LambdaRegularizationAnimation(Scene):
         positions = [LEFT*4, ORIGIN, RIGHT*4]
         colors = [RED, GREEN, BLUE]
         
+        # Coefficient heights per scenario: many large (no reg), some zero (optimal), all small (high)
+        heights_mat = np.array([
+            [2.5, 1.8, 3.2, 0.9, 1.6, 2.1, 1.4],
+            [1.5, 0.8, 1.8, 0, 0.9, 1.1, 0],
+            [0.3, 0.2, 0.4, 0, 0.1, 0.2, 0],
+        ])
+        descriptions = [
+            [("Complex Model", WHITE), ("High Variance", RED), ("Overfitting", RED)],
+            [("Balanced Model", WHITE), ("Good Tradeoff", GREEN), ("Feature Selection", GREEN)],
+            [("Simple Model", WHITE), ("High Bias", ORANGE), ("Underfitting", ORANGE)],
+        ]
+        
         scenario_groups = VGroup()
         
         for i, (scenario, pos, color) in enumerate(zip(scenarios, positions, colors)):
             # Title
-            scenario_title = Text(scenario, font_size=16, color=color, weight=BOLD)
+            scenario_title = _text(scenario, font_size=16, color=color, weight=BOLD)
             scenario_title.move_to(pos + UP*2.5)
             
-            # Coefficient representation
-            if i == 0:  # No regularization
-                coeff_heights = [2.5, 1.8, 3.2, 0.9, 1.6, 2.1, 1.4]  # Many large coefficients
-                description = VGroup(
-                    Text("Complex Model", font_size=12, color=WHITE),
-                    Text("High Variance", font_size=12, color=RED),
-                    Text("Overfitting", font_size=12, color=RED)
-                ).arrange(DOWN, buff=0.1)
-            elif i == 1:  # Optimal
-                coeff_heights = [1.5, 0.8, 1.8, 0, 0.9, 1.1, 0]  # Some coefficients zero
-                description = VGroup(
-                    Text("Balanced Model", font_size=12, color=WHITE),
-                    Text("Good Tradeoff", font_size=12, color=GREEN),
-                    Text("Feature Selection", font_size=12, color=GREEN)
-                ).arrange(DOWN, buff=0.1)
-            else:  # High regularization
-                coeff_heights = [0.3, 0.2, 0.4, 0, 0.1, 0.2, 0]  # All coefficients small
-                description = VGroup(
-                    Text("Simple Model", font_size=12, color=WHITE),
-                    Text("High Bias", font_size=12, color=ORANGE),
-                    Text("Underfitting", font_size=12, color=ORANGE)
-                ).arrange(DOWN, buff=0.1)
+            description = VGroup(*[
+                _text(line, font_size=12, color=line_color) for line, line_color in descriptions[i]
+            ]).arrange(DOWN, buff=0.1)
             
-            # Create coefficient bars
-            bars = VGroup()
-            for j, height in enumerate(coeff_heights):
-                if height > 0:
-                    bar = Rectangle(
-                        width=0.15,
-                        height=height,
-                        fill_color=color,
-                        fill_opacity=0.7,
-                        stroke_color=WHITE,
-                        stroke_width=1
-                    )
-                    bar.move_to(pos + LEFT*0.5 + RIGHT*j*0.15 + UP*height/2)
-                    bars.add(bar)
+            # Create coefficient bars, skipping zeroed coefficients
+            heights = heights_mat[i]
+            bars = VGroup(*[
+                Rectangle(
+                    width=0.15,
+                    height=heights[j],
+                    fill_color=color,
+                    fill_opacity=0.7,
+                    stroke_color=WHITE,
+                    stroke_width=1
+                ).move_to(pos + LEFT*0.5 + RIGHT*j*0.15 + UP*heights[j]/2)
+                for j in np.flatnonzero(heights)
+            ])
             
             description.next_to(bars, DOWN, buff=0.5)
             
@@ -458,11 +470,10 @@ class LambdaRegularizationAnimation(Scene):
             scenario_groups.add(scenario_group)
         
         # Animate scenarios appearing
-        for group in scenario_groups:
-            self.play(FadeIn(group), run_time=1)
+        self.play(LaggedStart(*[FadeIn(group) for group in scenario_groups], lag_ratio=0.5), run_time=2)
         
         # Add final message
-        final_message = Text("Tune λ with CV to balance bias-variance tradeoff!", 
+        final_message = _text("Tune λ with CV to balance bias-variance tradeoff!", 
                            font_size=18, color=YELLOW, weight=BOLD)
         final_message.to_edge(DOWN)
         
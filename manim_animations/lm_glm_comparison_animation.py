@@ -1,19 +1,37 @@
 from manim import *
 import numpy as np
+from text_cache import cached_text as _text
+
+def _lm_xy(rng):
+    """Noisy samples around the linear mean 2 + 1.5x"""
+    xs = np.arange(1, 9, 0.5)
+    return xs, 2 + 1.5*xs + rng.uniform(-1, 1, xs.size)
+
+def _glm_xy(rng):
+    """Noisy samples around the logistic mean 1 / (1 + e^-(x-5))"""
+    xs = np.arange(1, 9, 0.3)
+    return xs, 1/(1+np.exp(-(xs-5))) + rng.uniform(-0.1, 0.1, xs.size)
 
 class LM_GLM_ComparisonScene(Scene):
     def construct(self):
         self.camera.background_color = "#333333"  # Dark background to match the image
 
+        # The only LaTeX in the scene, compiled up front for the "Mean" row
+        lm_mean_tex = MathTex(r"\mu = \beta_0 + \beta_1 X_1 + \dots + \beta_p X_p", color=WHITE, font_size=28)
+        glm_mean_tex = VGroup(
+            MathTex(r"g(\mu) = \eta", color=WHITE, font_size=28),
+            _text("(link function)", font_size=24, color=WHITE)
+        ).arrange(DOWN, buff=0.1)
+
         # --- Title and Headers ---
-        title = Text("LM vs. GLM: Property Comparison", font_size=48, color=WHITE).to_edge(UP, buff=0.5)
+        title = _text("LM vs. GLM: Property Comparison", font_size=48, color=WHITE).to_edge(UP, buff=0.5)
         self.play(Write(title))
         self.wait(0.5)
 
         # Table Headers
-        prop_header = Text("Property", font_size=36, color=WHITE)
-        lm_header = Text("LMs", font_size=36, color=BLUE)
-        glm_header = Text("GLMs", font_size=36, color=RED)
+        prop_header = _text("Property", font_size=36, color=WHITE)
+        lm_header = _text("LMs", font_size=36, color=BLUE)
+        glm_header = _text("GLMs", font_size=36, color=RED)
 
         table_headers = VGroup(prop_header, lm_header, glm_header).arrange(RIGHT, buff=2.0)
         table_headers.next_to(title, DOWN, buff=0.8)
@@ -30,7 +48,7 @@ class LM_GLM_ComparisonScene(Scene):
         ]
         
         properties_mobjects = VGroup(*[
-            Text(prop, font_size=32, color=WHITE)
+            _text(prop, font_size=32, color=WHITE)
             for prop in properties_list_text
         ]).arrange(DOWN, buff=0.7, aligned_edge=LEFT)
         properties_mobjects.next_to(prop_header, DOWN, buff=0.5).align_to(prop_header, LEFT)
@@ -71,19 +89,16 @@ class LM_GLM_ComparisonScene(Scene):
 
             # LM explanation
             if prop_name == "Mean":
-                lm_exp_text = MathTex(r"\mu = \beta_0 + \beta_1 X_1 + \dots + \beta_p X_p", color=WHITE, font_size=28)
+                lm_exp_text = lm_mean_tex
             else:
-                lm_exp_text = Text(explanations[prop_name]["LM"], font_size=28, color=WHITE)
+                lm_exp_text = _text(explanations[prop_name]["LM"], font_size=28, color=WHITE)
             lm_exp_text.next_to(lm_header, DOWN, buff=(i+0.5)*0.7).scale(0.8)
             
             # GLM explanation
             if prop_name == "Mean":
-                glm_exp_text = VGroup(
-                    MathTex(r"g(\mu) = \eta", color=WHITE, font_size=28),
-                    Text("(link function)", font_size=24, color=WHITE)
-                ).arrange(DOWN, buff=0.1)
+                glm_exp_text = glm_mean_tex
             else:
-                glm_exp_text = Text(explanations[prop_name]["GLM"], font_size=28, color=WHITE)
+                glm_exp_text = _text(explanations[prop_name]["GLM"], font_size=28, color=WHITE)
             glm_exp_text.next_to(glm_header, DOWN, buff=(i+0.5)*0.7).scale(0.8)
 
             self.play(Write(lm_exp_text))
@@ -96,7 +111,7 @@ class LM_GLM_ComparisonScene(Scene):
         self.wait(1)
 
         # --- Link Function Note ---
-        note_text = Text(
+        note_text = _text(
             "Note: The link function in a GLM is applied to the target mean μ, "
             "the target variable itself is not transformed.",
             font_size=28,
@@ -109,17 +124,13 @@ class LM_GLM_ComparisonScene(Scene):
         # --- Additional Visual Examples ---
         self.play(FadeOut(VGroup(title, table_headers, properties_mobjects, note_text)))
         
-        # Clear previous explanations
-        all_explanations = VGroup()
-        for i in range(len(properties_list_text)):
-            all_explanations.add(properties_mobjects[i])
-        
         # Show visual examples
-        examples_title = Text("Visual Examples", font_size=48, color=WHITE).to_edge(UP, buff=0.5)
+        rng = np.random.default_rng(0)
+        examples_title = _text("Visual Examples", font_size=48, color=WHITE).to_edge(UP, buff=0.5)
         self.play(Write(examples_title))
         
         # LM Example
-        lm_example_title = Text("Linear Model Example", font_size=32, color=BLUE).move_to(UP * 1.5 + LEFT * 3)
+        lm_example_title = _text("Linear Model Example", font_size=32, color=BLUE).move_to(UP * 1.5 + LEFT * 3)
         
         # Create axes for LM
         lm_axes = Axes(
@@ -132,23 +143,16 @@ class LM_GLM_ComparisonScene(Scene):
             y_axis_config={"numbers_to_include": np.arange(0, 21, 4)},
         ).move_to(UP * 0.5 + LEFT * 3)
         
-        lm_x_label = lm_axes.get_x_axis_label(Text("X", font_size=24, color=WHITE))
-        lm_y_label = lm_axes.get_y_axis_label(Text("Y", font_size=24, color=WHITE))
+        lm_x_label = lm_axes.get_x_axis_label(_text("X", font_size=24, color=WHITE))
+        lm_y_label = lm_axes.get_y_axis_label(_text("Y", font_size=24, color=WHITE))
         
         # LM data points and line
-        lm_data = VGroup(*[
-            Dot(lm_axes.coords_to_point(x, 2 + 1.5*x + np.random.uniform(-1, 1)), color=BLUE, radius=0.05)
-            for x in np.arange(1, 9, 0.5)
-        ])
+        lm_xs, lm_ys = _lm_xy(rng)
+        lm_data = VGroup(*[Dot(p, color=BLUE, radius=0.05) for p in lm_axes.c2p(lm_xs, lm_ys).T])
         lm_line = lm_axes.plot(lambda x: 2 + 1.5*x, color=BLUE, stroke_width=3)
         
-        self.play(Write(lm_example_title))
-        self.play(Create(lm_axes), Write(lm_x_label), Write(lm_y_label))
-        self.play(FadeIn(lm_data))
-        self.play(Create(lm_line))
-        
         # GLM Example
-        glm_example_title = Text("GLM Example (Logistic)", font_size=32, color=RED).move_to(UP * 1.5 + RIGHT * 3)
+        glm_example_title = _text("GLM Example (Logistic)", font_size=32, color=RED).move_to(UP * 1.5 + RIGHT * 3)
         
         # Create axes for GLM
         glm_axes = Axes(
@@ -161,30 +165,40 @@ class LM_GLM_ComparisonScene(Scene):
             y_axis_config={"numbers_to_include": np.arange(0, 1.1, 0.2)},
         ).move_to(UP * 0.5 + RIGHT * 3)
         
-        glm_x_label = glm_axes.get_x_axis_label(Text("X", font_size=24, color=WHITE))
-        glm_y_label = glm_axes.get_y_axis_label(Text("P(Y=1)", font_size=24, color=WHITE))
+        glm_x_label = glm_axes.get_x_axis_label(_text("X", font_size=24, color=WHITE))
+        glm_y_label = glm_axes.get_y_axis_label(_text("P(Y=1)", font_size=24, color=WHITE))
         
         # GLM data points and curve
-        glm_data = VGroup(*[
-            Dot(glm_axes.coords_to_point(x, 1/(1+np.exp(-(x-5))) + np.random.uniform(-0.1, 0.1)), color=RED, radius=0.05)
-            for x in np.arange(1, 9, 0.3)
-        ])
+        glm_xs, glm_ys = _glm_xy(rng)
+        glm_data = VGroup(*[Dot(p, color=RED, radius=0.05) for p in glm_axes.c2p(glm_xs, glm_ys).T])
         glm_curve = glm_axes.plot(lambda x: 1/(1+np.exp(-(x-5))), color=RED, stroke_width=3)
         
-        self.play(Write(glm_example_title))
-        self.play(Create(glm_axes), Write(glm_x_label), Write(glm_y_label))
-        self.play(FadeIn(glm_data))
-        self.play(Create(glm_curve))
+        # Both panels sit on opposite sides of the screen, so build them side by side
+        lm_panel = AnimationGroup(
+            Write(lm_example_title),
+            AnimationGroup(Create(lm_axes), Write(lm_x_label), Write(lm_y_label)),
+            FadeIn(lm_data),
+            Create(lm_line),
+            lag_ratio=0.3
+        )
+        glm_panel = AnimationGroup(
+            Write(glm_example_title),
+            AnimationGroup(Create(glm_axes), Write(glm_x_label), Write(glm_y_label)),
+            FadeIn(glm_data),
+            Create(glm_curve),
+            lag_ratio=0.3
+        )
+        self.play(AnimationGroup(lm_panel, glm_panel))
         
         self.wait(2)
         
         # Key differences summary
-        differences_title = Text("Key Differences", font_size=36, color=YELLOW).move_to(DOWN * 1)
+        differences_title = _text("Key Differences", font_size=36, color=YELLOW).move_to(DOWN * 1)
         differences = VGroup(
-            Text("• LM: Linear relationship, normal errors", font_size=24, color=BLUE),
-            Text("• GLM: Non-linear relationship, exponential family", font_size=24, color=RED),
-            Text("• LM: Constant variance", font_size=24, color=BLUE),
-            Text("• GLM: Variance depends on mean", font_size=24, color=RED)
+            _text("• LM: Linear relationship, normal errors", font_size=24, color=BLUE),
+            _text("• GLM: Non-linear relationship, exponential family", font_size=24, color=RED),
+            _text("• LM: Constant variance", font_size=24, color=BLUE),
+            _text("• GLM: Variance depends on mean", font_size=24, color=RED)
         ).arrange(DOWN, buff=0.3, aligned_edge=LEFT)
         differences.move_to(DOWN * 2.5)
         
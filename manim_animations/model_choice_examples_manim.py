@@ -6,6 +6,7 @@ Shows specific examples of when to choose different modeling approaches
 
 from manim import *
 import numpy as np
+from text_cache import cached_text as _text
 
 class ModelChoiceGLMvsTreesExamples(Scene):
     def construct(self):
@@ -31,13 +32,13 @@ class ModelChoiceGLMvsTreesExamples(Scene):
     
     def show_intro(self):
         """Introduction with enhanced title"""
-        title = Text(
+        title = _text(
             "When to choose GLMs, Regularized GLMs, Single Trees, or Ensemble Trees?",
             font_size=32,
             color=WHITE
         ).to_edge(UP)
         
-        subtitle = Text(
+        subtitle = _text(
             "Real-world examples and decision framework",
             font_size=24,
             color=LIGHT_GRAY
@@ -53,20 +54,29 @@ class ModelChoiceGLMvsTreesExamples(Scene):
         """Create interpretability vs complexity axes"""
         origin = LEFT*5.5 + DOWN*2.5
         
-        # Axes
-        x_axis = Arrow(origin, origin + RIGHT*11, color=WHITE, stroke_width=4, max_tip_length_to_length_ratio=0.03)
-        y_axis = Arrow(origin, origin + UP*5, color=WHITE, stroke_width=4, max_tip_length_to_length_ratio=0.03)
+        # Axes: one unit per scene unit, with the (0, 0) corner placed at origin
+        axes = Axes(
+            x_range=[0, 11, 1],
+            y_range=[0, 5, 1],
+            x_length=11,
+            y_length=5,
+            tips=True,
+            axis_config={"color": WHITE, "stroke_width": 4, "include_ticks": False}
+        )
+        axes.shift(origin - axes.c2p(0, 0))
+        x_axis, y_axis = axes.x_axis, axes.y_axis
         
         # Labels
-        x_label = Text("Predictive Power / Complexity →", font_size=24, color=WHITE).next_to(x_axis, DOWN, buff=0.3)
-        y_label = Text("Interpretability ↑", font_size=24, color=WHITE).rotate(PI/2).next_to(y_axis, LEFT, buff=0.3)
-        speed_note = Text("(speed ↓ as you move right)", font_size=18, color=GRAY).next_to(x_label, DOWN, buff=0.1)
+        x_label = _text("Predictive Power / Complexity →", font_size=24, color=WHITE).next_to(x_axis, DOWN, buff=0.3)
+        y_label = _text("Interpretability ↑", font_size=24, color=WHITE).rotate(PI/2).next_to(y_axis, LEFT, buff=0.3)
+        speed_note = _text("(speed ↓ as you move right)", font_size=18, color=GRAY).next_to(x_label, DOWN, buff=0.1)
         
-        self.play(Create(x_axis), Create(y_axis))
+        self.play(Create(axes))
         self.play(Write(x_label), Write(y_label), FadeIn(speed_note))
         self.wait(1)
         
         self.origin = origin
+        self.axes = axes
     
     def create_model_card(self, title_text, bullets, color=WHITE, width=5.0, height=2.8):
         """Create enhanced model cards with examples"""
@@ -82,12 +92,12 @@ class ModelChoiceGLMvsTreesExamples(Scene):
         )
         
         # Title with emphasis
-        title = Text(title_text, font_size=28, color=color, weight=BOLD)
+        title = _text(title_text, font_size=28, color=color, weight=BOLD)
         
         # Bullet points with better formatting
         bullet_lines = VGroup()
         for bullet in bullets:
-            bullet_text = Text(f"• {bullet}", font_size=20, color=WHITE)
+            bullet_text = _text(f"• {bullet}", font_size=20, color=WHITE)
             bullet_lines.add(bullet_text)
         
         bullet_lines.arrange(DOWN, aligned_edge=LEFT, buff=0.12)
@@ -176,12 +186,12 @@ class ModelChoiceGLMvsTreesExamples(Scene):
     def highlight_model(self, card, description, color):
         """Highlight a specific model with description"""
         # Footer description
-        footer = Text(description, font_size=28, color=WHITE).to_edge(DOWN, buff=0.6)
+        footer = _text(description, font_size=28, color=WHITE).to_edge(DOWN, buff=0.6)
         self.play(Write(footer))
         
         # Highlight effect
         glow = SurroundingRectangle(card, color=color, buff=0.15, stroke_width=8)
-        checkmark = Text("✓", font_size=48, color=color).next_to(card, UP, buff=0.3)
+        checkmark = _text("✓", font_size=48, color=color).next_to(card, UP, buff=0.3)
         
         self.play(Create(glow), FadeIn(checkmark, scale=0.8))
         self.wait(2)
@@ -215,7 +225,7 @@ class ModelChoiceGLMvsTreesExamples(Scene):
     
     def show_practical_examples(self):
         """Show specific practical examples"""
-        examples_title = Text("Practical Examples", font_size=36, color=YELLOW, weight=BOLD).to_edge(UP)
+        examples_title = _text("Practical Examples", font_size=36, color=YELLOW, weight=BOLD).to_edge(UP)
         self.play(ReplacementTransform(self.title, examples_title))
         
         # Create example scenarios
@@ -250,11 +260,9 @@ class ModelChoiceGLMvsTreesExamples(Scene):
             }
         ]
         
-        # Show scenarios one by one
-        for i, scenario in enumerate(scenarios):
-            scenario_box = self.create_scenario_box(scenario)
-            scenario_box.move_to(ORIGIN)
-            
+        # Build every scenario box up front, then show them one by one
+        scenario_boxes = [self.create_scenario_box(scenario).move_to(ORIGIN) for scenario in scenarios]
+        for scenario_box in scenario_boxes:
             self.play(FadeIn(scenario_box))
             self.wait(3)
             self.play(FadeOut(scenario_box))
@@ -271,10 +279,10 @@ class ModelChoiceGLMvsTreesExamples(Scene):
             fill_opacity=0.1
         )
         
-        title = Text(scenario["title"], font_size=32, color=scenario["color"], weight=BOLD)
-        description = Text(scenario["description"], font_size=24, color=WHITE)
-        recommendation = Text(f"Recommended: {scenario['recommendation']}", font_size=28, color=GREEN, weight=BOLD)
-        reason = Text(f"Why: {scenario['reason']}", font_size=22, color=LIGHT_GRAY)
+        title = _text(scenario["title"], font_size=32, color=scenario["color"], weight=BOLD)
+        description = _text(scenario["description"], font_size=24, color=WHITE)
+        recommendation = _text(f"Recommended: {scenario['recommendation']}", font_size=28, color=GREEN, weight=BOLD)
+        reason = _text(f"Why: {scenario['reason']}", font_size=22, color=LIGHT_GRAY)
         
         content = VGroup(title, description, recommendation, reason).arrange(DOWN, buff=0.5)
         content.move_to(box.get_center())
@@ -284,42 +292,40 @@ class ModelChoiceGLMvsTreesExamples(Scene):
     def show_closing_summary(self):
         """Show closing summary with cheat sheet"""
         # Clear screen
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(FadeOut(Group(*self.mobjects)))
         
-        summary_title = Text("Quick Decision Guide", font_size=40, color=YELLOW, weight=BOLD).to_edge(UP)
+        summary_title = _text("Quick Decision Guide", font_size=40, color=YELLOW, weight=BOLD).to_edge(UP)
         self.play(Write(summary_title))
         
         # Create summary points
         summary_points = VGroup(
-            Text("GLMs → interpretability, known distribution", font_size=24, color=YELLOW),
-            Text("Regularized GLMs → auto selection + shrinkage (L1/L2/EN)", font_size=24, color=GOLD),
-            Text("Single Trees → clear rules; nonlinearity & interactions", font_size=24, color=BLUE),
-            Text("Ensemble Trees → best accuracy; slower & less interpretable", font_size=24, color=ORANGE)
+            _text("GLMs → interpretability, known distribution", font_size=24, color=YELLOW),
+            _text("Regularized GLMs → auto selection + shrinkage (L1/L2/EN)", font_size=24, color=GOLD),
+            _text("Single Trees → clear rules; nonlinearity & interactions", font_size=24, color=BLUE),
+            _text("Ensemble Trees → best accuracy; slower & less interpretable", font_size=24, color=ORANGE)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.4).shift(UP*0.5)
         
         # Animate summary points
-        for point in summary_points:
-            self.play(Write(point))
-            self.wait(0.8)
+        self.play(LaggedStart(*[Write(point) for point in summary_points], lag_ratio=0.5))
+        self.wait(0.8)
         
         # Add decision flowchart
-        flowchart_title = Text("Decision Flowchart:", font_size=28, color=WHITE, weight=BOLD).next_to(summary_points, DOWN, buff=1)
+        flowchart_title = _text("Decision Flowchart:", font_size=28, color=WHITE, weight=BOLD).next_to(summary_points, DOWN, buff=1)
         
         flowchart_steps = VGroup(
-            Text("1. Interpretability required? → GLMs or Single Trees", font_size=20, color=WHITE),
-            Text("2. Many features (p > n)? → Regularized GLMs", font_size=20, color=WHITE),
-            Text("3. Complex nonlinear patterns? → Trees", font_size=20, color=WHITE), 
-            Text("4. Maximum accuracy needed? → Ensemble Trees", font_size=20, color=WHITE),
-            Text("5. Fast inference required? → GLMs or Single Trees", font_size=20, color=WHITE)
+            _text("1. Interpretability required? → GLMs or Single Trees", font_size=20, color=WHITE),
+            _text("2. Many features (p > n)? → Regularized GLMs", font_size=20, color=WHITE),
+            _text("3. Complex nonlinear patterns? → Trees", font_size=20, color=WHITE), 
+            _text("4. Maximum accuracy needed? → Ensemble Trees", font_size=20, color=WHITE),
+            _text("5. Fast inference required? → GLMs or Single Trees", font_size=20, color=WHITE)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.25).next_to(flowchart_title, DOWN, buff=0.3)
         
         self.play(Write(flowchart_title))
-        for step in flowchart_steps:
-            self.play(Write(step))
-            self.wait(0.5)
+        self.play(LaggedStart(*[Write(step) for step in flowchart_steps], lag_ratio=0.5))
+        self.wait(0.5)
         
         # Final message with emphasis
-        final_message = Text(
+        final_message = _text(
             "Remember: The best model depends on your specific problem constraints!",
             font_size=26,
             color=GREEN,
@@ -329,16 +335,17 @@ class ModelChoiceGLMvsTreesExamples(Scene):
         self.play(Write(final_message))
         self.wait(3)
         
+        self._closing_group = VGroup(summary_title, summary_points, flowchart_title, flowchart_steps, final_message)
+        
         # Add algorithm examples
         self.show_algorithm_examples()
     
     def show_algorithm_examples(self):
         """Show specific algorithm examples"""
-        algo_title = Text("Common Algorithm Examples", font_size=32, color=CYAN, weight=BOLD).to_edge(UP)
-        self.play(Transform(self.mobjects[0], algo_title))
+        algo_title = _text("Common Algorithm Examples", font_size=32, color=CYAN, weight=BOLD).to_edge(UP)
         
-        # Clear other content
-        self.play(*[FadeOut(mob) for mob in self.mobjects[1:]])
+        # Swap the closing summary for the new title
+        self.play(FadeOut(self._closing_group), FadeIn(algo_title))
         
         # Algorithm categories
         categories = [
@@ -367,11 +374,10 @@ class ModelChoiceGLMvsTreesExamples(Scene):
         # Position categories in 2x2 grid
         positions = [UP*1.5 + LEFT*3, UP*1.5 + RIGHT*3, DOWN*1.5 + LEFT*3, DOWN*1.5 + RIGHT*3]
         
-        for category, pos in zip(categories, positions):
-            category_box = self.create_algorithm_box(category)
-            category_box.move_to(pos)
-            self.play(FadeIn(category_box))
-            self.wait(1)
+        self.play(LaggedStart(*[
+            FadeIn(self.create_algorithm_box(category).move_to(pos))
+            for category, pos in zip(categories, positions)
+        ], lag_ratio=0.5))
         
         self.wait(2)
     
@@ -387,11 +393,11 @@ class ModelChoiceGLMvsTreesExamples(Scene):
             fill_opacity=0.1
         )
         
-        title = Text(category["title"], font_size=24, color=category["color"], weight=BOLD)
+        title = _text(category["title"], font_size=24, color=category["color"], weight=BOLD)
         
         algorithms = VGroup()
         for algo in category["algorithms"]:
-            algo_text = Text(f"• {algo}", font_size=18, color=WHITE)
+            algo_text = _text(f"• {algo}", font_size=18, color=WHITE)
             algorithms.add(algo_text)
         
         algorithms.arrange(DOWN, aligned_edge=LEFT, buff=0.1)
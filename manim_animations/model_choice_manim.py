@@ -4,15 +4,18 @@ Model Choice: GLMs vs Trees Animation
 Shows when to choose GLMs, regularized GLMs, single trees, or ensemble trees
 """
 
+import html
+
 from manim import *
 import numpy as np
+from text_cache import cached_text as _text
 
 class ModelChoiceGLMvsTrees(Scene):
     def construct(self):
         self.camera.background_color = "#1E1E1E"
         
         # Title
-        title = Text(
+        title = _text(
             "When might you choose GLMs, regularized GLMs, single trees, or ensemble trees?",
             font_size=32,
             color=WHITE
@@ -41,13 +44,13 @@ class ModelChoiceGLMvsTrees(Scene):
                       color=WHITE, stroke_width=4, max_tip_length_to_length_ratio=0.03)
         
         # Labels
-        x_label = Text("Predictive Power / Complexity →", font_size=24, color=WHITE)\
+        x_label = _text("Predictive Power / Complexity →", font_size=24, color=WHITE)\
             .next_to(x_axis, DOWN, buff=0.3)
-        y_label = Text("Interpretability ↑", font_size=24, color=WHITE)\
+        y_label = _text("Interpretability ↑", font_size=24, color=WHITE)\
             .rotate(PI/2).next_to(y_axis, LEFT, buff=0.3)
         
         # Speed note
-        speed_note = Text("(speed ↓ as you move right)", font_size=20, color=GRAY)\
+        speed_note = _text("(speed ↓ as you move right)", font_size=20, color=GRAY)\
             .next_to(x_label, DOWN, buff=0.1)
         
         self.play(Create(x_axis), Create(y_axis))
@@ -71,15 +74,10 @@ class ModelChoiceGLMvsTrees(Scene):
         )
         
         # Title
-        title = Text(title_text, font_size=26, color=color, weight=BOLD)
-        
-        # Bullet points
-        bullet_lines = VGroup()
-        for bullet in bullets:
-            bullet_text = Text(f"• {bullet}", font_size=20, color=WHITE)
-            bullet_lines.add(bullet_text)
+        title = _text(title_text, font_size=26, color=color, weight=BOLD)
         
-        bullet_lines.arrange(DOWN, aligned_edge=LEFT, buff=0.15)
+        # Bullet points, laid out by Pango as one block; escaped since none of them is markup
+        bullet_lines = MarkupText("\n".join(f"• {html.escape(bullet)}" for bullet in bullets), font_size=20, color=WHITE)
         
         # Arrange content
         content = VGroup(title, bullet_lines).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
@@ -120,21 +118,19 @@ class ModelChoiceGLMvsTrees(Scene):
         tree_card.move_to(LEFT*0.8 + DOWN*0.2)     # Moderate interpretability, moderate complexity  
         ens_card.move_to(RIGHT*3.2 + DOWN*1.2)     # Low interpretability, high complexity
         
-        # Animate cards appearing
-        self.play(
-            FadeIn(glm_card, shift=UP*0.5),
-            FadeIn(reg_glm_card, shift=UP*0.5),
-            FadeIn(tree_card, shift=UP*0.5), 
-            FadeIn(ens_card, shift=UP*0.5)
-        )
-        
         # Add connector arrows to show progression
         arrow1 = Arrow(glm_card.get_right(), reg_glm_card.get_left(), 
                       color=GRAY, stroke_width=2, max_tip_length_to_length_ratio=0.1)
         arrow2 = Arrow(tree_card.get_right(), ens_card.get_left(),
                       color=GRAY, stroke_width=2, max_tip_length_to_length_ratio=0.1)
         
-        self.play(GrowArrow(arrow1), GrowArrow(arrow2))
+        # Animate cards appearing, with the arrows growing in as they land
+        cards = [glm_card, reg_glm_card, tree_card, ens_card]
+        self.play(AnimationGroup(
+            AnimationGroup(*[FadeIn(card, shift=UP*0.5) for card in cards], lag_ratio=0.1),
+            AnimationGroup(GrowArrow(arrow1), GrowArrow(arrow2)),
+            lag_ratio=0.5
+        ))
         self.wait(1)
         
         # Store cards for later use
@@ -143,15 +139,13 @@ class ModelChoiceGLMvsTrees(Scene):
         self.tree_card = tree_card
         self.ens_card = ens_card
     
-    def highlight_card(self, card, question_text, highlight_color):
-        """Highlight a specific card with question"""
+    def highlight_card(self, card, question, glow, highlight_color):
+        """Highlight a specific card with its prebuilt question and glow"""
         # Show question
-        question = Text(question_text, font_size=28, color=WHITE).to_edge(DOWN, buff=0.8)
         self.play(Write(question))
         
         # Highlight card
-        glow = SurroundingRectangle(card, color=highlight_color, buff=0.15, stroke_width=6)
-        checkmark = Text("✓", font_size=48, color=highlight_color).next_to(card, UP, buff=0.3)
+        checkmark = _text("✓", font_size=48, color=highlight_color).next_to(card, UP, buff=0.3)
         
         self.play(Create(glow), FadeIn(checkmark, scale=0.7))
         self.wait(2)
@@ -159,70 +153,55 @@ class ModelChoiceGLMvsTrees(Scene):
         
     def show_scenarios(self):
         """Show different scenarios and which model to choose"""
-        # Scenario 1: GLMs
-        self.highlight_card(
-            self.glm_card,
+        cards = [self.glm_card, self.reg_glm_card, self.tree_card, self.ens_card]
+        colors = [YELLOW, GOLD, BLUE, ORANGE]
+        question_texts = [
             "Use GLMs when interpretability and known distributions are key",
-            YELLOW
-        )
-        
-        # Scenario 2: Regularized GLMs  
-        self.highlight_card(
-            self.reg_glm_card,
             "Use regularized GLMs for automatic selection and overfitting control",
-            GOLD
-        )
-        
-        # Scenario 3: Single Trees
-        self.highlight_card(
-            self.tree_card,
             "Use single trees for interpretable models with complex relationships",
-            BLUE
-        )
-        
-        # Scenario 4: Ensemble Trees
-        self.highlight_card(
-            self.ens_card,
             "Use ensemble trees for maximum accuracy (when interpretability is less important)",
-            ORANGE
-        )
+        ]
+        
+        # Build every glow and question up front
+        glows = [SurroundingRectangle(card, color=color, buff=0.15, stroke_width=6) for card, color in zip(cards, colors)]
+        questions = [_text(q, font_size=28, color=WHITE).to_edge(DOWN, buff=0.8) for q in question_texts]
+        
+        # Scenarios 1-4: GLMs, regularized GLMs, single trees, ensemble trees
+        for card, question, glow, color in zip(cards, questions, glows, colors):
+            self.highlight_card(card, question, glow, color)
     
     def show_summary(self):
         """Show final summary of recommendations"""
-        summary_title = Text("Quick Decision Guide", font_size=32, color=YELLOW, weight=BOLD).to_corner(UL, buff=0.8)
+        summary_title = _text("Quick Decision Guide", font_size=32, color=YELLOW, weight=BOLD).to_corner(UL, buff=0.8)
         
         summary_points = VGroup(
-            Text("GLMs → interpretability + known distributions", font_size=22, color=YELLOW),
-            Text("Regularized GLMs → variable selection + shrinkage", font_size=22, color=GOLD),
-            Text("Single Trees → clear rules + nonlinear patterns", font_size=22, color=BLUE),
-            Text("Ensemble Trees → best accuracy (less interpretable)", font_size=22, color=ORANGE)
+            _text("GLMs → interpretability + known distributions", font_size=22, color=YELLOW),
+            _text("Regularized GLMs → variable selection + shrinkage", font_size=22, color=GOLD),
+            _text("Single Trees → clear rules + nonlinear patterns", font_size=22, color=BLUE),
+            _text("Ensemble Trees → best accuracy (less interpretable)", font_size=22, color=ORANGE)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.3).next_to(summary_title, DOWN, buff=0.4)
         
         # Animate summary
         self.play(Write(summary_title))
-        for point in summary_points:
-            self.play(Write(point))
-            self.wait(0.8)
+        self.play(LaggedStart(*[Write(point) for point in summary_points], lag_ratio=0.7, run_time=len(summary_points)*0.9))
         
         # Add decision flowchart
-        flowchart_title = Text("Decision Flowchart:", font_size=24, color=WHITE, weight=BOLD)\
+        flowchart_title = _text("Decision Flowchart:", font_size=24, color=WHITE, weight=BOLD)\
             .next_to(summary_points, DOWN, buff=0.8)
         
         flowchart = VGroup(
-            Text("1. Need interpretability? → GLMs or Single Trees", font_size=18, color=WHITE),
-            Text("2. Have many features? → Regularized GLMs", font_size=18, color=WHITE), 
-            Text("3. Complex patterns? → Trees (single or ensemble)", font_size=18, color=WHITE),
-            Text("4. Maximum accuracy? → Ensemble Trees", font_size=18, color=WHITE)
+            _text("1. Need interpretability? → GLMs or Single Trees", font_size=18, color=WHITE),
+            _text("2. Have many features? → Regularized GLMs", font_size=18, color=WHITE), 
+            _text("3. Complex patterns? → Trees (single or ensemble)", font_size=18, color=WHITE),
+            _text("4. Maximum accuracy? → Ensemble Trees", font_size=18, color=WHITE)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2).next_to(flowchart_title, DOWN, buff=0.3)
         
         self.play(Write(flowchart_title))
-        for step in flowchart:
-            self.play(Write(step))
-            self.wait(0.6)
+        self.play(LaggedStart(*[Write(step) for step in flowchart], lag_ratio=0.7, run_time=len(flowchart)*0.8))
         
         # Final message
         self.wait(2)
-        final_message = Text(
+        final_message = _text(
             "Choose the right tool for your specific problem and constraints!",
             font_size=26,
             color=GREEN
@@ -235,12 +214,15 @@ class ModelChoiceGLMvsTrees(Scene):
         self.show_performance_comparison()
     
     def show_performance_comparison(self):
-        """Show a simple performance comparison chart"""
+        """Show a simple performance comparison chart (skipped in -ql/-qm previews)"""
+        if config.quality in ("low_quality", "medium_quality"):
+            return
+        
         # Clear previous content
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(FadeOut(Group(*self.mobjects)))
         
         # New title
-        comp_title = Text("Performance vs Interpretability Trade-off", font_size=36, color=YELLOW).to_edge(UP)
+        comp_title = _text("Performance vs Interpretability Trade-off", font_size=36, color=YELLOW).to_edge(UP)
         self.play(Write(comp_title))
         
         # Create bar chart
@@ -258,7 +240,7 @@ class ModelChoiceGLMvsTrees(Scene):
             axis_config={"include_numbers": False}
         ).shift(DOWN*0.5)
         
-        y_label = Text("Score", font_size=20, color=WHITE).next_to(chart_axes, LEFT).rotate(PI/2)
+        y_label = _text("Score", font_size=20, color=WHITE).next_to(chart_axes, LEFT).rotate(PI/2)
         
         self.play(Create(chart_axes), Write(y_label))
         
@@ -266,6 +248,18 @@ class ModelChoiceGLMvsTrees(Scene):
         bar_width = 0.3
         bars_performance = VGroup()
         bars_interpretability = VGroup()
+        model_labels = VGroup()
+        
+        # The chart axes are affine, so every bar center and label anchor comes from one basis
+        origin = chart_axes.c2p(0, 0)
+        ex = chart_axes.c2p(1, 0) - origin
+        ey = chart_axes.c2p(0, 1) - origin
+        xs = np.arange(len(models))
+        perf_arr = np.array(performance)
+        interp_arr = np.array(interpretability)
+        perf_centers = origin + np.outer(xs - 0.15, ex) + np.outer(perf_arr/2, ey)
+        interp_centers = origin + np.outer(xs + 0.15, ex) + np.outer(interp_arr/2, ey)
+        label_anchors = origin + np.outer(xs, ex)
         
         for i, (model, perf, interp, color) in enumerate(zip(models, performance, interpretability, colors)):
             # Performance bars
@@ -275,7 +269,7 @@ class ModelChoiceGLMvsTrees(Scene):
                 fill_color=color,
                 fill_opacity=0.8,
                 stroke_color=color
-            ).move_to(chart_axes.c2p(i - 0.15, perf/2))
+            ).move_to(perf_centers[i])
             
             # Interpretability bars  
             interp_bar = Rectangle(
@@ -285,31 +279,49 @@ class ModelChoiceGLMvsTrees(Scene):
                 fill_opacity=0.4,
                 stroke_color=color,
                 stroke_width=2
-            ).move_to(chart_axes.c2p(i + 0.15, interp/2))
+            ).move_to(interp_centers[i])
             
             bars_performance.add(perf_bar)
             bars_interpretability.add(interp_bar)
             
             # Model labels
-            model_label = Text(model, font_size=16, color=WHITE).next_to(chart_axes.c2p(i, 0), DOWN, buff=0.3)
-            self.play(Write(model_label), run_time=0.5)
+            model_labels.add(_text(model, font_size=16, color=WHITE).next_to(label_anchors[i], DOWN, buff=0.3))
+        
+        self.play(LaggedStart(*[Write(label) for label in model_labels], lag_ratio=0.7, run_time=len(model_labels)*0.5))
         
         # Add legend
         legend = VGroup(
             VGroup(Rectangle(width=0.3, height=0.2, fill_color=WHITE, fill_opacity=0.8), 
-                   Text("Performance", font_size=16, color=WHITE)).arrange(RIGHT, buff=0.2),
+                   _text("Performance", font_size=16, color=WHITE)).arrange(RIGHT, buff=0.2),
             VGroup(Rectangle(width=0.3, height=0.2, fill_color=WHITE, fill_opacity=0.4, stroke_color=WHITE), 
-                   Text("Interpretability", font_size=16, color=WHITE)).arrange(RIGHT, buff=0.2)
+                   _text("Interpretability", font_size=16, color=WHITE)).arrange(RIGHT, buff=0.2)
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2).to_corner(UR, buff=1)
         
         self.play(Create(bars_performance), Create(bars_interpretability), FadeIn(legend))
         
         # Key insight
-        insight = Text(
+        insight = _text(
             "The eternal trade-off: Performance vs Interpretability",
             font_size=24,
             color=RED
         ).next_to(chart_axes, DOWN, buff=0.8)
         
         self.play(Write(insight))
-        self.wait(3)
\ No newline at end of file
+        self.wait(3)
+
+if __name__ == "__main__":
+    # Render this scene and ModelChoiceSimple side by side, one manim process each
+    import os
+    import subprocess
+    import sys
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    manim = os.getenv("MANIM_EXECUTABLE", "manim")
+    jobs = [
+        (os.path.join(here, "model_choice_manim.py"), "ModelChoiceGLMvsTrees"),
+        (os.path.join(here, "model_choice_simple_manim.py"), "ModelChoiceSimple"),
+    ]
+    procs = [subprocess.Popen([manim, "render", "-qh", path, scene]) for path, scene in jobs]
+    # The first failure wins; a child killed by a signal has a negative code that max() would hide
+    codes = [proc.wait() for proc in procs]
+    sys.exit(next((code for code in codes if code), 0))
@@ -4,14 +4,17 @@ Model Choice GLM vs Trees Examples - Simplified Animation
 Shows when to choose different modeling approaches with examples
 """
 
+import html
+
 from manim import *
+from text_cache import cached_text as _text
 
 class ModelChoiceSimple(Scene):
     def construct(self):
         self.camera.background_color = "#1E1E1E"
         
         # Title
-        title = Text(
+        title = _text(
             "When to choose GLMs, Regularized GLMs, Single Trees, or Ensemble Trees?",
             font_size=28,
             color=WHITE
@@ -40,9 +43,9 @@ class ModelChoiceSimple(Scene):
                       color=WHITE, stroke_width=3, max_tip_length_to_length_ratio=0.03)
         
         # Labels
-        x_label = Text("Predictive Power / Complexity →", font_size=20, color=WHITE)\
+        x_label = _text("Predictive Power / Complexity →", font_size=20, color=WHITE)\
             .next_to(x_axis, DOWN, buff=0.3)
-        y_label = Text("Interpretability ↑", font_size=20, color=WHITE)\
+        y_label = _text("Interpretability ↑", font_size=20, color=WHITE)\
             .rotate(PI/2).next_to(y_axis, LEFT, buff=0.3)
         
         self.play(Create(x_axis), Create(y_axis))
@@ -81,7 +84,6 @@ class ModelChoiceSimple(Scene):
         
         # Show cards
         cards = [glm_card, reg_glm_card, tree_card, ens_card]
-        self.play(*[FadeIn(card, shift=UP*0.5) for card in cards])
         
         # Add connecting arrows
         arrow1 = Arrow(glm_card.get_right(), reg_glm_card.get_left(), 
@@ -89,7 +91,12 @@ class ModelChoiceSimple(Scene):
         arrow2 = Arrow(tree_card.get_right(), ens_card.get_left(),
                       color=GRAY, stroke_width=2, max_tip_length_to_length_ratio=0.1)
         
-        self.play(GrowArrow(arrow1), GrowArrow(arrow2))
+        # Cards fade in and the arrows grow in as they land, in one play
+        self.play(AnimationGroup(
+            AnimationGroup(*[FadeIn(card, shift=UP*0.5) for card in cards], lag_ratio=0.1),
+            AnimationGroup(GrowArrow(arrow1), GrowArrow(arrow2)),
+            lag_ratio=0.5
+        ))
         self.wait(2)
         
         self.cards = cards
@@ -108,15 +115,10 @@ class ModelChoiceSimple(Scene):
         )
         
         # Title
-        title_text = Text(title, font_size=22, color=color, weight=BOLD)
-        
-        # Bullet points
-        bullet_group = VGroup()
-        for bullet in bullets:
-            bullet_text = Text(f"• {bullet}", font_size=16, color=WHITE)
-            bullet_group.add(bullet_text)
+        title_text = _text(title, font_size=22, color=color, weight=BOLD)
         
-        bullet_group.arrange(DOWN, aligned_edge=LEFT, buff=0.1)
+        # Bullet points, laid out by Pango as one block; escaped since none of them is markup
+        bullet_group = MarkupText("\n".join(f"• {html.escape(bullet)}" for bullet in bullets), font_size=16, color=WHITE)
         
         # Arrange content
         content = VGroup(title_text, bullet_group).arrange(DOWN, buff=0.2)
@@ -153,29 +155,32 @@ class ModelChoiceSimple(Scene):
             }
         ]
         
-        for i, example in enumerate(examples):
+        # Each example highlights its card, holds, then clears in one play of its own.
+        # Sharing a single outer Succession would add every glow and text on its first frame.
+        for card, example in zip(self.cards, examples):
             # Highlight corresponding card
-            card = self.cards[i]
             glow = SurroundingRectangle(card, color=example["color"], buff=0.1, stroke_width=6)
             
             # Show example
             example_text = VGroup(
-                Text(f"Example: {example['title']}", font_size=24, color=example["color"], weight=BOLD),
-                Text(example["description"], font_size=20, color=WHITE),
-                Text(f"→ {example['choice']}", font_size=22, color=GREEN, weight=BOLD)
+                _text(f"Example: {example['title']}", font_size=24, color=example["color"], weight=BOLD),
+                _text(example["description"], font_size=20, color=WHITE),
+                _text(f"→ {example['choice']}", font_size=22, color=GREEN, weight=BOLD)
             ).arrange(DOWN, buff=0.3).to_edge(DOWN, buff=1)
             
-            self.play(Create(glow), FadeIn(example_text))
-            self.wait(3)
-            self.play(FadeOut(glow), FadeOut(example_text))
+            self.play(Succession(
+                AnimationGroup(Create(glow), FadeIn(example_text)),
+                Wait(3),
+                AnimationGroup(FadeOut(glow), FadeOut(example_text))
+            ))
     
     def show_summary(self):
         """Show final summary"""
         # Clear screen
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.play(FadeOut(Group(*self.mobjects)))
         
         # Summary title
-        summary_title = Text("Quick Decision Guide", font_size=36, color=YELLOW, weight=BOLD).to_edge(UP)
+        summary_title = _text("Quick Decision Guide", font_size=36, color=YELLOW, weight=BOLD).to_edge(UP)
         self.play(Write(summary_title))
         
         # Summary points
@@ -188,17 +193,15 @@ class ModelChoiceSimple(Scene):
         
         summary_group = VGroup()
         for model, description, color in points:
-            point_text = Text(f"{model} → {description}", font_size=24, color=color)
+            point_text = _text(f"{model} → {description}", font_size=24, color=color)
             summary_group.add(point_text)
         
         summary_group.arrange(DOWN, aligned_edge=LEFT, buff=0.5).shift(UP*0.5)
         
-        for point in summary_group:
-            self.play(Write(point))
-            self.wait(0.8)
+        self.play(LaggedStart(*[Write(point) for point in summary_group], lag_ratio=0.7, run_time=len(summary_group)*0.9))
         
         # Final message
-        final_msg = Text(
+        final_msg = _text(
             "Choose based on your priorities: interpretability vs accuracy!",
             font_size=24,
             color=GREEN,
@@ -169,12 +169,14 @@ class OversamplingMetricsScene(Scene):
         )
 
     def scatter_points(self, axes, pts, color=WHITE, radius=0.04, alpha=1.0):
-        dots = VGroup()
-        for x, y in pts:
-            d = Dot(axes.coords_to_point(x, y), radius=radius, color=color)
-            d.set_opacity(alpha)
-            dots.add(d)
-        return dots
+        # The axes map is affine: map every point through its origin and unit steps at once
+        pts = np.asarray(pts)
+        ox = axes.coords_to_point(0, 0)
+        ex = axes.coords_to_point(1, 0) - ox
+        ey = axes.coords_to_point(0, 1) - ox
+        screen = ox + pts[:, 0:1]*ex + pts[:, 1:2]*ey
+        dots = VGroup(*[Dot(p, radius=radius, color=color) for p in screen])
+        return dots.set_opacity(alpha)
 
     def curvy_boundary(self, axes, shift=0.0, color=GREY_B):
         xs = np.linspace(-2.5, 2.5, 80)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Render one scene in parallel chunks and stitch the pieces with ffmpeg.
+
+Usage:
+    python manim_animations/render_parallel.py [scene_file] [SceneName] [--workers N] [--quality l|m|h|p|k]
+
+Manim renders every animation of a scene in order, but each frame only
+depends on the scene state, which a worker can rebuild by skipping the
+animations before its chunk (``-n start,end``). The scene's animations are
+split into contiguous ranges, each range is rendered by its own manim
+process, and the partial movies are concatenated without re-encoding.
+
+Every worker re-runs ``construct``, so the scene must be deterministic: an
+unseeded random generator draws different data in each chunk and the joined
+video jumps at the chunk boundaries.
+"""
+import argparse
+import glob
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+MANIM_EXECUTABLE = os.getenv("MANIM_EXECUTABLE", "manim")
+FFMPEG_EXECUTABLE = os.getenv("FFMPEG_EXECUTABLE", "ffmpeg")
+
+DEFAULT_SCENE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kmeans_animation.py")
+DEFAULT_SCENE = "KMeansAnimation"
+
+# manim's -q flags and the config.quality names they select
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def count_animations(scene_file, scene_name, quality="h"):
+    """Run the scene once as a dry run and return how many animations it plays.
+
+    The dry run uses the same quality as the chunks, since a scene may play
+    different animations at different qualities.
+    """
+    from manim import tempconfig
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(scene_file)))
+    spec = importlib.util.spec_from_file_location("_scene_module", scene_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    with tempconfig({"dry_run": True, "disable_caching": True, "quality": QUALITIES[quality]}):
+        scene = getattr(module, scene_name)()
+        scene.render()
+        return scene.renderer.num_plays
+
+
+def split_ranges(n_animations, n_chunks):
+    """Split animation indices 0..n_animations-1 into inclusive (start, end) ranges."""
+    n_chunks = max(1, min(n_chunks, n_animations))
+    bounds = [round(i * n_animations / n_chunks) for i in range(n_chunks + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(n_chunks)]
+
+
+def render_chunk(scene_file, scene_name, quality, start, end, media_dir):
+    """Render animations start..end (inclusive) into media_dir and return the movie path."""
+    output_name = f"part_{start:04d}"
+    result = subprocess.run(
+        [
+            MANIM_EXECUTABLE, "render", f"-q{quality}",
+            "-n", f"{start},{end}",
+            "--media_dir", media_dir,
+            "-o", output_name,
+            scene_file, scene_name,
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Rendering animations {start}-{end} failed:\n{result.stderr}")
+
+    movies = glob.glob(os.path.join(media_dir, "videos", "**", f"{output_name}.mp4"), recursive=True)
+    if not movies:
+        raise RuntimeError(f"No movie was written for animations {start}-{end}")
+    return movies[0]
+
+
+def concat_movies(movies, output_path):
+    """Join the partial movies in order without re-encoding."""
+    list_path = output_path + ".txt"
+    with open(list_path, "w") as list_file:
+        for movie in movies:
+            list_file.write(f"file '{os.path.abspath(movie)}'\n")
+    try:
+        subprocess.run(
+            [FFMPEG_EXECUTABLE, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", list_path, "-c", "copy", output_path],
+            check=True,
+        )
+    finally:
+        os.remove(list_path)
+
+
+def render_parallel(scene_file, scene_name, workers=None, quality="l", output_path=None):
+    workers = workers or os.cpu_count() or 1
+    output_path = output_path or f"{scene_name}.mp4"
+    ranges = split_ranges(count_animations(scene_file, scene_name, quality), workers)
+
+    tmpdir = tempfile.mkdtemp(prefix=f"{scene_name}_")
+    try:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(render_chunk, scene_file, scene_name, quality, start, end,
+                            os.path.join(tmpdir, f"part_{start:04d}"))
+                for start, end in ranges
+            ]
+            movies = [future.result() for future in futures]
+        concat_movies(movies, output_path)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene_file", nargs="?", default=DEFAULT_SCENE_FILE)
+    parser.add_argument("scene_name", nargs="?", default=DEFAULT_SCENE)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--quality", default="l", choices=["l", "m", "h", "p", "k"])
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    path = render_parallel(args.scene_file, args.scene_name, args.workers, args.quality, args.output)
+    print(f"Check the generated video at: {path}")
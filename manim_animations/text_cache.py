@@ -0,0 +1,33 @@
+"""Shape Text and compile MathTex once per distinct input, handing out copies.
+
+Pango layout and LaTeX compilation dominate the setup time of the text-heavy
+scenes, which build many labels with the same string and style. Scenes import
+the helpers from this module (``from text_cache import cached_text as _text``)
+and position the copy they get back.
+"""
+from functools import lru_cache
+
+from manim import DEFAULT_FONT_SIZE, NORMAL, WHITE, MathTex, Text
+
+
+@lru_cache(maxsize=256)
+def _shaped_text(text, font_size, color, weight, slant):
+    return Text(text, font_size=font_size, color=color, weight=weight, slant=slant)
+
+
+def cached_text(text, font_size=DEFAULT_FONT_SIZE, color=WHITE, weight=NORMAL, slant=NORMAL):
+    """Text shaped once per (string, style) and copied per use."""
+    # Colors are keyed by their string form so any color spec hashes the same way
+    return _shaped_text(text, font_size, str(color), weight, slant).copy()
+
+
+@lru_cache(maxsize=64)
+def _compiled_tex(tex_strings, color, tex_to_color_map):
+    return MathTex(*tex_strings, color=color, tex_to_color_map=dict(tex_to_color_map))
+
+
+def cached_tex(*tex_strings, color=WHITE, tex_to_color_map=None):
+    """MathTex compiled once per (strings, color, color map) and copied per use."""
+    # An ordered tuple rather than a frozenset, so substrings are colored in the given order
+    color_map = tuple((tex, str(c)) for tex, c in (tex_to_color_map or {}).items())
+    return _compiled_tex(tex_strings, str(color), color_map).copy()
@@ -0,0 +1,72 @@
+"""Write rendered frames to ffmpeg from a background thread.
+
+Importing this module patches manim's SceneFileWriter so that the frames
+sent down the ffmpeg pipe go through a small queue drained by a daemon
+thread. The render loop only blocks when the queue is full, so rasterizing
+the next frame overlaps with writing the previous one.
+
+Recent manim releases encode frames on their own writer thread and no
+longer pipe to ffmpeg through ``SceneFileWriter.open_movie_pipe``; on those
+the patch is skipped.
+"""
+import queue
+import threading
+
+from manim.scene.scene_file_writer import SceneFileWriter
+
+QUEUE_SIZE = 8
+
+
+class _QueuedPipe:
+    """File-like stand-in for ffmpeg's stdin that writes from a worker thread."""
+
+    def __init__(self, pipe, maxsize=QUEUE_SIZE):
+        self.pipe = pipe
+        self.frames = queue.Queue(maxsize=maxsize)
+        self.error = None
+        self.thread = threading.Thread(target=self._drain, daemon=True)
+        self.thread.start()
+
+    def _drain(self):
+        while True:
+            data = self.frames.get()
+            if data is None:
+                return
+            if self.error is None:
+                try:
+                    self.pipe.write(data)
+                except Exception as e:
+                    self.error = e
+
+    def write(self, data):
+        if self.error is not None:
+            raise self.error
+        self.frames.put(data)
+
+    def close(self):
+        self.frames.put(None)
+        self.thread.join()
+        self.pipe.close()
+        if self.error is not None:
+            raise self.error
+
+    def __getattr__(self, name):
+        return getattr(self.pipe, name)
+
+
+def install():
+    """Patch SceneFileWriter once; a no-op when manim has no ffmpeg pipe to wrap."""
+    if not hasattr(SceneFileWriter, "open_movie_pipe") or getattr(SceneFileWriter, "_threaded_frames", False):
+        return
+
+    open_movie_pipe = SceneFileWriter.open_movie_pipe
+
+    def threaded_open_movie_pipe(self, *args, **kwargs):
+        open_movie_pipe(self, *args, **kwargs)
+        self.writing_process.stdin = _QueuedPipe(self.writing_process.stdin)
+
+    SceneFileWriter.open_movie_pipe = threaded_open_movie_pipe
+    SceneFileWriter._threaded_frames = True
+
+
+install()